@@ -0,0 +1,46 @@
+import base64
+import io
+import tracemalloc
+
+import pytest
+
+# Row counts of the bulk `many=True` benchmarks.
+ROW_COUNTS = (1_000, 10_000, 100_000)
+
+# Sizes of the decoded payloads of the memory benchmarks, in MB.
+PAYLOAD_SIZES = (1, 10, 100)
+
+
+def image_bytes(size=(64, 64), format='PNG'):
+    from PIL import Image
+    output = io.BytesIO()
+    Image.new('RGB', size, (255, 0, 0)).save(output, format=format)
+    return output.getvalue()
+
+
+def measure_peak_memory(func, *args):
+    """
+    Return the result of `func(*args)` and the peak of the memory allocated
+    while running it, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+@pytest.fixture(scope='session')
+def base64_image():
+    return base64.b64encode(image_bytes()).decode()
+
+
+@pytest.fixture(scope='session', params=PAYLOAD_SIZES, ids=lambda size: f'{size}MB')
+def base64_pdf(request):
+    """
+    A base64 PDF payload decoding to the parametrized number of MB.
+    """
+    content = b'%PDF-1.4\n' + b'\0' * (request.param * 1024 * 1024 - 9)
+    return base64.b64encode(content).decode()
@@ -0,0 +1,195 @@
+import datetime
+import tempfile
+from decimal import Decimal
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+from rest_framework import serializers
+
+from drf_extra_fields.compat import DateRange, DateTimeTZRange, NumericRange
+from drf_extra_fields.fields import (
+    Base64FileField,
+    Base64ImageField,
+    Base64ListSerializer,
+    DateRangeField,
+    DateTimeRangeField,
+    DecimalRangeField,
+    IntegerRangeField,
+    LowercaseEmailField,
+    RangeListSerializer,
+    find_overlapping_ranges,
+)
+
+from .conftest import ROW_COUNTS, image_bytes, measure_peak_memory
+
+
+class PDFBase64FileField(Base64FileField):
+    ALLOWED_TYPES = ('pdf',)
+
+
+class RangeSerializer(serializers.Serializer):
+    integers = IntegerRangeField()
+    decimals = DecimalRangeField()
+    dates = DateRangeField()
+    datetimes = DateTimeRangeField()
+
+
+class BatchRangeSerializer(RangeSerializer):
+    class Meta:
+        list_serializer_class = RangeListSerializer
+
+
+class SlotSerializer(serializers.Serializer):
+    slot = DateTimeRangeField(source='datetimes')
+
+
+class BatchSlotSerializer(SlotSerializer):
+    class Meta:
+        list_serializer_class = RangeListSerializer
+
+
+class EmailSerializer(serializers.Serializer):
+    email = LowercaseEmailField()
+
+
+class ImageSerializer(serializers.Serializer):
+    image = Base64ImageField()
+
+    class Meta:
+        list_serializer_class = Base64ListSerializer
+
+
+def get_range_row(index):
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(hours=index)
+    return {
+        'integers': NumericRange(index, index + 10),
+        'decimals': NumericRange(Decimal('0.5') * index, Decimal('0.5') * index + 1),
+        'dates': DateRange(start.date(), start.date() + datetime.timedelta(days=1)),
+        'datetimes': DateTimeTZRange(start, start + datetime.timedelta(hours=1)),
+    }
+
+
+class TestBase64ImageField:
+    def test_to_internal_value(self, benchmark, base64_image):
+        field = Base64ImageField()
+        assert benchmark(field.to_internal_value, base64_image).image.format == 'PNG'
+
+    def test_to_internal_value_with_header(self, benchmark, base64_image):
+        field = Base64ImageField()
+        benchmark(field.to_internal_value, 'data:image/png;base64,' + base64_image)
+
+    def test_to_representation(self, benchmark):
+        field = Base64ImageField(represent_in_base64=True)
+        file = ContentFile(image_bytes(), name='image.png')
+        assert benchmark(field.to_representation, file)
+
+
+class TestBase64FileField:
+    def test_to_internal_value(self, benchmark, base64_pdf):
+        field = PDFBase64FileField()
+        benchmark.pedantic(field.to_internal_value, (base64_pdf,), rounds=3)
+
+    @pytest.mark.parametrize('max_memory_size', [None, 0], ids=['memory', 'spooled'])
+    def test_peak_memory(self, benchmark, base64_pdf, max_memory_size):
+        field = PDFBase64FileField(max_memory_size=max_memory_size)
+        file, peak = measure_peak_memory(field.to_internal_value, base64_pdf)
+        benchmark.extra_info['peak_memory'] = peak
+        if max_memory_size is not None:
+            # Spooled payloads are decoded a chunk at a time.
+            assert peak < 1024 * 1024
+        file.close()
+        benchmark.pedantic(lambda: field.to_internal_value(base64_pdf).close(), rounds=3)
+
+    def test_write_to_storage_peak_memory(self, benchmark, base64_pdf):
+        with tempfile.TemporaryDirectory() as location:
+            field = PDFBase64FileField(write_to_storage=True, storage=FileSystemStorage(location=location))
+            _, peak = measure_peak_memory(field.to_internal_value, base64_pdf)
+            benchmark.extra_info['peak_memory'] = peak
+            assert peak < 1024 * 1024
+            benchmark.pedantic(field.to_internal_value, (base64_pdf,), rounds=3)
+
+
+class TestRangeFields:
+    def test_to_internal_value(self, benchmark):
+        field = DateTimeRangeField()
+        data = {'lower': '2020-01-01T00:00:00Z', 'upper': '2020-01-02T00:00:00Z', 'bounds': '[)'}
+        benchmark(field.to_internal_value, data)
+
+    def test_to_internal_value_native_bounds(self, benchmark):
+        field = DateTimeRangeField()
+        row = get_range_row(0)['datetimes']
+        benchmark(field.to_internal_value, {'lower': row.lower, 'upper': row.upper, 'bounds': '[)'})
+
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_internal_value_native_bounds(self, benchmark, rows):
+        data = [
+            {key: {'lower': value.lower, 'upper': value.upper} for key, value in get_range_row(index).items()}
+            for index in range(rows)
+        ]
+
+        def validate():
+            serializer = RangeSerializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+
+        benchmark.pedantic(validate, rounds=3)
+
+    def test_to_representation(self, benchmark):
+        field = DateTimeRangeField()
+        benchmark(field.to_representation, get_range_row(0)['datetimes'])
+
+    @pytest.mark.parametrize('serializer_class', [RangeSerializer, BatchRangeSerializer])
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_representation(self, benchmark, rows, serializer_class):
+        instances = [get_range_row(index) for index in range(rows)]
+        data = benchmark.pedantic(lambda: serializer_class(instances, many=True).data, rounds=3)
+        assert len(data) == rows
+
+    @pytest.mark.parametrize('serializer_class', [SlotSerializer, BatchSlotSerializer])
+    @override_settings(USE_TZ=True)
+    def test_many_datetime_ranges_to_representation(self, benchmark, serializer_class):
+        instances = [get_range_row(index) for index in range(ROW_COUNTS[-1])]
+        benchmark.pedantic(lambda: serializer_class(instances, many=True).data, rounds=3)
+
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_internal_value(self, benchmark, rows):
+        data = RangeSerializer([get_range_row(index) for index in range(rows)], many=True).data
+
+        def validate():
+            serializer = RangeSerializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+
+        benchmark.pedantic(validate, rounds=3)
+
+
+class TestNonOverlappingRanges:
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_find_overlapping_ranges(self, benchmark, rows):
+        # Hourly slots in reverse order, so that they have to be sorted.
+        ranges = [get_range_row(index)['datetimes'] for index in reversed(range(rows))]
+        assert benchmark(find_overlapping_ranges, ranges) == []
+
+
+class TestLowercaseEmailField:
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_internal_value(self, benchmark, rows):
+        data = [{'email': f'User.{index}@Example.com'} for index in range(rows)]
+
+        def validate():
+            serializer = EmailSerializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+
+        benchmark.pedantic(validate, rounds=3)
+
+
+class TestBase64ListSerializer:
+    @pytest.mark.parametrize('rows', ROW_COUNTS[:2])
+    def test_many_to_internal_value(self, benchmark, base64_image, rows):
+        data = [{'image': base64_image} for _ in range(rows)]
+
+        def validate():
+            serializer = ImageSerializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+
+        benchmark.pedantic(validate, rounds=1)
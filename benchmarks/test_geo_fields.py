@@ -0,0 +1,41 @@
+import pytest
+from django.contrib.gis.geos import Point
+from rest_framework import serializers
+
+from drf_extra_fields.geo_fields import PointField
+
+from .conftest import ROW_COUNTS
+
+
+class PointSerializer(serializers.Serializer):
+    point = PointField()
+
+
+class TestPointField:
+    def test_to_internal_value(self, benchmark):
+        field = PointField()
+        benchmark(field.to_internal_value, {'latitude': 49.8782482189424, 'longitude': 24.452545489})
+
+    def test_to_internal_value_from_str(self, benchmark):
+        field = PointField()
+        benchmark(field.to_internal_value, "{'latitude': 49.8782482189424, 'longitude': 24.452545489}")
+
+    def test_to_representation(self, benchmark):
+        field = PointField(str_points=True)
+        benchmark(field.to_representation, Point(24.452545489, 49.8782482189424))
+
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_representation(self, benchmark, rows):
+        instances = [{'point': Point(index % 180, index % 90)} for index in range(rows)]
+        data = benchmark.pedantic(lambda: PointSerializer(instances, many=True).data, rounds=3)
+        assert len(data) == rows
+
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_internal_value(self, benchmark, rows):
+        data = [{'point': {'latitude': index % 90, 'longitude': index % 180}} for index in range(rows)]
+
+        def validate():
+            serializer = PointSerializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+
+        benchmark.pedantic(validate, rounds=3)
@@ -0,0 +1,35 @@
+import pytest
+from rest_framework import serializers
+
+from drf_extra_fields.relations import PresentablePrimaryKeyRelatedField, PresentableSlugRelatedField
+from tests.utils import MockObject, MockQueryset
+
+from .conftest import ROW_COUNTS
+
+
+class PresentationSerializer(serializers.Serializer):
+    def to_representation(self, instance):
+        return {'pk': instance.pk, 'name': instance.name}
+
+
+class TestPresentableRelatedFields:
+    def test_primary_key_to_representation(self, benchmark):
+        field = PresentablePrimaryKeyRelatedField(
+            queryset=MockQueryset([]), presentation_serializer=PresentationSerializer
+        )
+        benchmark(field.to_representation, MockObject(pk=1, name='foo'))
+
+    def test_slug_to_representation(self, benchmark):
+        field = PresentableSlugRelatedField(
+            slug_field='name', queryset=MockQueryset([]), presentation_serializer=PresentationSerializer
+        )
+        benchmark(field.to_representation, MockObject(pk=1, name='foo'))
+
+    @pytest.mark.parametrize('rows', ROW_COUNTS)
+    def test_many_to_representation(self, benchmark, rows):
+        field = PresentablePrimaryKeyRelatedField(
+            queryset=MockQueryset([]), presentation_serializer=PresentationSerializer, many=True
+        )
+        instances = [MockObject(pk=index, name=str(index)) for index in range(rows)]
+        data = benchmark.pedantic(field.to_representation, (instances,), rounds=3)
+        assert len(data) == rows
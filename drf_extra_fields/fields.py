@@ -1,11 +1,33 @@
+import asyncio
 import base64
 import binascii
+import contextlib
+import contextvars
+import datetime
+import decimal
+import functools
+import hashlib
 import io
+import math
+import mimetypes
+import posixpath
+import re
+import threading
 import uuid
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import filetype
-from django.core.exceptions import ValidationError
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.validators import validate_image_file_extension
+from django.db.models.fields.files import FieldFile
+from django.utils import translation
+from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
 from rest_framework.fields import (
     DateField,
@@ -17,18 +39,368 @@ from rest_framework.fields import (
     FloatField,
     ImageField,
     IntegerField,
+    ListField,
 )
-from rest_framework.serializers import ModelSerializer
+from rest_framework import ISO_8601
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.serializers import ListSerializer, ModelSerializer
+from rest_framework.settings import api_settings
 from rest_framework.utils import html
 
 from drf_extra_fields import compat
 from drf_extra_fields.compat import DateRange, DateTimeTZRange, NumericRange
+from drf_extra_fields.file_types import get_file_type_detector
+from drf_extra_fields.instrumentation import FieldEvent, emit, instrumented, listeners
 
 DEFAULT_CONTENT_TYPE = "application/octet-stream"
 
+# Characters that ``base64.b64decode`` silently discards in its default
+# (non-validating) mode, e.g. the line breaks of MIME style base64, for str
+# and bytes input.
+BASE64_DISCARDED = {str: re.compile(r"[^A-Za-z0-9+/=]"), bytes: re.compile(rb"[^A-Za-z0-9+/=]")}
+URLSAFE_BASE64_DISCARDED = {str: re.compile(r"[^A-Za-z0-9_=-]"), bytes: re.compile(rb"[^A-Za-z0-9_=-]")}
+URLSAFE_BASE64_TRANSLATION = {str: str.maketrans("-_", "+/"), bytes: bytes.maketrans(b"-_", b"+/")}
+# Padding appended to URL-safe base64, which is commonly sent without it.
+URLSAFE_BASE64_PADDING = {str: "==", bytes: b"=="}
+# Number of URL-safe base64 characters translated and decoded at once, must
+# be a multiple of 4.
+URLSAFE_BASE64_CHUNK_SIZE = 64 * 1024
+
+# Well-formed base64, checked before decoding with `validate_base64`.
+STRICT_BASE64 = {str: re.compile(r"[A-Za-z0-9+/]*={0,2}"), bytes: re.compile(rb"[A-Za-z0-9+/]*={0,2}")}
+STRICT_URLSAFE_BASE64 = {str: re.compile(r"[A-Za-z0-9_-]*={0,2}"), bytes: re.compile(rb"[A-Za-z0-9_-]*={0,2}")}
+
+# Input types accepted by base64 fields, besides str any bytes-like object.
+BASE64_BUFFER_TYPES = (bytes, bytearray, memoryview)
+BASE64_INPUT_TYPES = (str,) + BASE64_BUFFER_TYPES
+
+# Number of leading characters searched for the data URI header.
+MAX_BASE64_HEADER_LENGTH = 256
+
+
+# The header of a base64 data URI up to ``;base64,``, ``data:`` is optional.
+DATA_URI_HEADER = re.compile(r"(?:data:)?(?P<mime_type>[\w.+-]+/[\w.+-]+)?(?P<parameters>(?:;[\w.+-]+=[^;,]*)*)")
+
+DataURIHeader = namedtuple("DataURIHeader", ["mime_type", "parameters", "offset"])
+
+
+def parse_data_uri_header(base64_data):
+    """
+    Parse the ``data:<mime type>[;<name>=<value>]*;base64,`` header of a data
+    URI in the first ``MAX_BASE64_HEADER_LENGTH`` characters of
+    ``base64_data``, without scanning or copying the rest of the payload.
+    Return a ``DataURIHeader`` with the offset of the payload, or ``None`` if
+    there is no header. Raise ``ValueError`` if the header is malformed.
+    """
+    prefix = base64_data[:MAX_BASE64_HEADER_LENGTH]
+    if not isinstance(prefix, str):
+        prefix = bytes(prefix).decode("ascii", "replace")
+    index = prefix.find(";base64,")
+    if index == -1:
+        return None
+    match = DATA_URI_HEADER.fullmatch(prefix, 0, index)
+    if match is None:
+        raise ValueError("Malformed data URI header")
+    parameters = dict(parameter.split("=", 1) for parameter in match.group("parameters").split(";")[1:])
+    return DataURIHeader(match.group("mime_type"), parameters, index + len(";base64,"))
+
+
+def decode_base64(base64_data, urlsafe=False):
+    """
+    Decode ``base64_data`` (a str or bytes-like object) at once, discarding
+    characters outside of the alphabet like ``base64.b64decode`` does. With
+    ``urlsafe``, the URL-safe alphabet is used and padding is optional.
+    """
+    if urlsafe:
+        # Translated a chunk at a time instead of copying the whole payload.
+        return b"".join(iter_base64_decode(base64_data, URLSAFE_BASE64_CHUNK_SIZE, urlsafe))
+    return binascii.a2b_base64(base64_data)
+
+
+def decode_base64_quanta(base64_data, urlsafe=False):
+    """
+    Decode ``base64_data``, a str or bytes of complete 4 character quanta
+    (except for missing URL-safe padding) and nothing outside the alphabet.
+    """
+    if urlsafe:
+        kind = type(base64_data)
+        base64_data = base64_data.translate(URLSAFE_BASE64_TRANSLATION[kind])
+        if len(base64_data) % 4:
+            base64_data += URLSAFE_BASE64_PADDING[kind][:-len(base64_data) % 4]
+    return binascii.a2b_base64(base64_data)
+
+
+def validate_base64(base64_data, urlsafe=False):
+    """
+    Raise ``ValueError`` unless ``base64_data`` is well-formed base64, which
+    stops at the first invalid character instead of decoding anything.
+    """
+    kind = str if isinstance(base64_data, str) else bytes
+    if not (STRICT_URLSAFE_BASE64 if urlsafe else STRICT_BASE64)[kind].fullmatch(base64_data):
+        raise ValueError("Invalid base64 character")
+    if len(base64_data) % 4 == 1 or (not urlsafe and len(base64_data) % 4):
+        raise ValueError("Incorrect base64 padding")
+
+
+def iter_base64_decode(base64_data, chunk_size, urlsafe=False):
+    """
+    Decode ``base64_data`` (a str or bytes-like object) piece by piece,
+    yielding the decoded bytes of at most ``chunk_size`` input characters at
+    a time, so that the whole decoded payload never has to be held in memory.
+    """
+    kind = str if isinstance(base64_data, str) else bytes
+    discarded = (URLSAFE_BASE64_DISCARDED if urlsafe else BASE64_DISCARDED)[kind]
+    empty = kind()
+    leftover = empty
+    for start in range(0, len(base64_data), chunk_size):
+        chunk = leftover + discarded.sub(empty, base64_data[start:start + chunk_size])
+        # Only complete 4 character quanta can be decoded independently.
+        boundary = len(chunk) - len(chunk) % 4
+        leftover = chunk[boundary:]
+        if boundary:
+            yield decode_base64_quanta(chunk[:boundary], urlsafe)
+    if leftover:
+        yield decode_base64_quanta(leftover, urlsafe)
+
+
+class Base64DecodingReader(io.RawIOBase):
+    """
+    A read-only stream of the decoded ``base64_data``, decoded piece by piece
+    as it is read, so that storages can consume it like any other file.
+    """
+
+    def __init__(self, base64_data, chunk_size, urlsafe=False):
+        super().__init__()
+        self.decoded_chunks = iter_base64_decode(base64_data, chunk_size, urlsafe)
+        self.pending = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.pending:
+            try:
+                self.pending = memoryview(next(self.decoded_chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+
+def iter_base64_encode(file, chunk_size):
+    """
+    Encode the contents of the open `file` piece by piece, yielding the
+    encoded str of at most `chunk_size` bytes at a time.
+    """
+    leftover = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        chunk = leftover + chunk
+        # Only complete 3 byte groups can be encoded without padding.
+        boundary = len(chunk) - len(chunk) % 3
+        leftover = chunk[boundary:]
+        if boundary:
+            yield base64.b64encode(chunk[:boundary]).decode()
+    if leftover:
+        yield base64.b64encode(leftover).decode()
+
+
+class LazyBase64String(Promise):
+    """
+    The base64 representation of a file, encoded only when it's needed.
+
+    Streaming renderers can write it incrementally through `chunks()`. Like
+    Django's lazy translation strings it is a `Promise`, so DRF's
+    `JSONEncoder` renders it as a regular string.
+    """
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+
+    def chunks(self):
+        try:
+            with self.file.open() as f:
+                yield from iter_base64_encode(f, self.chunk_size)
+        except Exception:
+            raise OSError("Error encoding file")
+
+    def __str__(self):
+        return "".join(self.chunks())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBase64String):
+            other = str(other)
+        return str(self) == other
+
+    __hash__ = None
+
+
+class Base64RepresentationCache:
+    """
+    A thread-safe LRU cache of base64 representations, bounded by the total
+    length of the cached strings. If `cache_alias` is given, entries are also
+    shared through that Django cache, e.g. between worker processes.
+    """
+
+    def __init__(self, max_size=16 * 1024 * 1024, cache_alias=None, timeout=None):
+        self.max_size = max_size
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_cache_key(self, key):
+        return "drf_extra_fields.base64:" + hashlib.md5(repr(key).encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self.cache_alias is not None:
+            value = caches[self.cache_alias].get(self.get_cache_key(key))
+            if value is not None:
+                self._store(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        self._store(key, value)
+        if self.cache_alias is not None:
+            caches[self.cache_alias].set(self.get_cache_key(key), value, self.timeout)
+
+    def _store(self, key, value):
+        if len(value) > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class Base64BatchResult:
+    """
+    The outcome of decoding a base64 value ahead of time through
+    `Base64FieldMixin.to_internal_values`, passed to `to_internal_value` in
+    place of the raw value.
+    """
+
+    def __init__(self, value, error=None):
+        self.value = value
+        self.error = error
+
+
+def call_in_language(language, func, *args):
+    """
+    Call `func` with `language` active, for work offloaded to other threads,
+    which don't inherit the active language of the request.
+    """
+    with translation.override(language):
+        return func(*args)
+
+
+class StoredFile(FieldFile):
+    """
+    A validated file whose content is already stored as `name` in `storage`,
+    returned by base64 fields with `content_addressed_names` in place of the
+    uploaded file. It carries the metadata of the validated file, like
+    `image`, `content_type` and `renditions`, and is already committed, so
+    model `FileField`s refer to the stored file instead of saving it again.
+    """
+
+    def __init__(self, file, name, storage):
+        File.__init__(self, file, name)
+        self.storage = storage
+        self._committed = True
+        for attribute in ("content_type", "charset", "image", "renditions"):
+            if hasattr(file, attribute):
+                setattr(self, attribute, getattr(file, attribute))
+
+
+base64_executor = None
+base64_executor_lock = threading.Lock()
+
+
+def get_base64_executor():
+    """
+    Return the thread pool that async base64 field methods offload their work
+    to. Its size, set by the `DRF_EXTRA_FIELDS_ASYNC_MAX_WORKERS` setting,
+    bounds how many of them run concurrently.
+    """
+    global base64_executor
+    with base64_executor_lock:
+        if base64_executor is None:
+            base64_executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "DRF_EXTRA_FIELDS_ASYNC_MAX_WORKERS", None),
+                thread_name_prefix="drf_extra_fields",
+            )
+        return base64_executor
+
+
+async def run_in_base64_executor(func, *args):
+    """
+    Run `func` on the executor of `get_base64_executor()`, with the context
+    variables and the active language of the caller, which `run_in_executor`
+    doesn't carry over to the worker thread by itself.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_base64_executor(), context.run, call_in_language, translation.get_language(), func, *args
+    )
+
+
+def get_decoded_size(base64_data):
+    """
+    Compute the decoded length of `base64_data` from its length and padding,
+    without decoding it. Exact for canonical base64, an upper bound otherwise.
+    """
+    tail = base64_data[-2:]
+    if not isinstance(tail, str):
+        tail = bytes(tail).decode("ascii", "replace")
+    return len(base64_data) * 3 // 4 - (len(tail) - len(tail.rstrip("=")))
+
 
 class Base64FieldMixin:
     EMPTY_VALUES = (None, "", [], (), {})
+    # Number of base64 characters decoded at once when spooling to disk,
+    # must be a multiple of 4.
+    DECODE_CHUNK_SIZE = 64 * 1024
+    # Number of leading base64 characters decoded to sniff the file type
+    # before the rest of the payload, must be a multiple of 4.
+    HEADER_CHUNK_SIZE = 684
+    # Number of file bytes encoded at once for `represent_in_base64`, must be
+    # a multiple of 3.
+    ENCODE_CHUNK_SIZE = 48 * 1024
+    # Algorithm of the content hash used by `content_addressed_names`.
+    HASH_ALGORITHM = "sha256"
 
     @property
     def ALLOWED_TYPES(self):
@@ -42,28 +414,111 @@ class Base64FieldMixin:
     def INVALID_TYPE_MESSAGE(self):
         raise NotImplementedError
 
+    TOO_LARGE_MESSAGE = _("Ensure this file does not exceed {max_size} bytes.")
+    CONTENT_TYPE_MISMATCH_MESSAGE = _("The declared content type doesn't match the type of the file.")
+
     def __init__(self, *args, **kwargs):
         self.trust_provided_content_type = kwargs.pop("trust_provided_content_type", False)
+        self.validate_content_type = kwargs.pop("validate_content_type", False)
+        self.urlsafe_base64 = kwargs.pop("urlsafe_base64", False)
+        self.validate_base64 = kwargs.pop("validate_base64", False)
         self.represent_in_base64 = kwargs.pop("represent_in_base64", False)
+        self.lazy_representation = kwargs.pop("lazy_representation", False)
+        self.representation_cache = kwargs.pop("representation_cache", None)
+        self.max_memory_size = kwargs.pop("max_memory_size", None)
+        self.max_decoded_size = kwargs.pop("max_decoded_size", None)
+        self.content_addressed_names = kwargs.pop("content_addressed_names", False)
+        self.storage = kwargs.pop("storage", None)
+        self.upload_to = kwargs.pop("upload_to", "")
+        self.write_to_storage = kwargs.pop("write_to_storage", False)
         super().__init__(*args, **kwargs)
 
+    def get_max_decoded_size(self):
+        if self.max_decoded_size is not None:
+            return self.max_decoded_size
+        return getattr(settings, "DRF_EXTRA_FIELDS_BASE64_MAX_DECODED_SIZE", None)
+
     def to_internal_value(self, base64_data):
+        # Already decoded, and reported, by `to_internal_values`
+        if isinstance(base64_data, Base64BatchResult):
+            if base64_data.error is not None:
+                raise base64_data.error
+            return base64_data.value
+        return self.base64_to_internal_value(base64_data)
+
+    @instrumented(operation="to_internal_value")
+    def base64_to_internal_value(self, base64_data):
         # Check if this is a base64 string
         if base64_data in self.EMPTY_VALUES:
             return None
 
-        if isinstance(base64_data, str):
+        if isinstance(base64_data, BASE64_BUFFER_TYPES):
+            # Bytes-like input is decoded straight from its buffer, unless
+            # it's strided, which only a copy can be cast to bytes from.
+            base64_data = memoryview(base64_data)
+            if not base64_data.c_contiguous:
+                base64_data = memoryview(base64_data.tobytes())
+            base64_data = base64_data.cast("B")
+            if not base64_data:
+                return None
+
+        if isinstance(base64_data, BASE64_INPUT_TYPES):
             file_mime_type = None
 
             # Strip base64 header, get mime_type from base64 header.
-            if ";base64," in base64_data:
-                header, base64_data = base64_data.split(";base64,")
+            try:
+                header = parse_data_uri_header(base64_data)
+            except ValueError:
+                raise ValidationError(self.INVALID_FILE_MESSAGE)
+            declared_mime_type = None
+            if header is not None:
+                base64_data = base64_data[header.offset:]
+                declared_mime_type = header.mime_type
                 if self.trust_provided_content_type:
-                    file_mime_type = header.replace("data:", "")
+                    file_mime_type = declared_mime_type
+
+            # Reject oversized payloads before allocating anything for them.
+            decoded_size = get_decoded_size(base64_data)
+            max_decoded_size = self.get_max_decoded_size()
+            if max_decoded_size is not None and decoded_size > max_decoded_size:
+                raise ValidationError(str(self.TOO_LARGE_MESSAGE).format(max_size=max_decoded_size))
+
+            # Reject malformed payloads before decoding any of them, but only
+            # after the size check, which doesn't scan them.
+            if self.validate_base64:
+                try:
+                    validate_base64(base64_data, self.urlsafe_base64)
+                except ValueError:
+                    raise ValidationError(self.INVALID_FILE_MESSAGE)
+
+            # Reject disallowed types from the leading bytes alone, before
+            # decoding the whole payload.
+            try:
+                decoded_header = next(
+                    iter_base64_decode(base64_data, self.HEADER_CHUNK_SIZE, self.urlsafe_base64), b""
+                )
+            except (TypeError, binascii.Error, ValueError):
+                raise ValidationError(self.INVALID_FILE_MESSAGE)
+            header_extension = self.get_header_extension(decoded_header)
+            if header_extension is not None and header_extension not in self.ALLOWED_TYPES:
+                raise ValidationError(self.INVALID_TYPE_MESSAGE)
+            if header_extension is not None:
+                self.validate_declared_content_type(declared_mime_type, header_extension)
+
+            # Stream the payload into the storage without keeping it around.
+            if self.write_to_storage:
+                if header_extension is None:
+                    raise ValidationError(self.INVALID_TYPE_MESSAGE)
+                return self.save_to_storage(base64_data, header_extension)
 
             # Try to decode the file. Return validation error if it fails.
+            # Payloads larger than `max_memory_size` are decoded into a
+            # temporary file on disk instead of memory.
             try:
-                decoded_file = base64.b64decode(base64_data)
+                if self.max_memory_size is not None and decoded_size > self.max_memory_size:
+                    decoded_file = self.decode_to_temporary_file(base64_data, file_mime_type)
+                else:
+                    decoded_file = decode_base64(base64_data, self.urlsafe_base64)
             except (TypeError, binascii.Error, ValueError):
                 raise ValidationError(self.INVALID_FILE_MESSAGE)
 
@@ -75,24 +530,201 @@ class Base64FieldMixin:
 
             if file_extension not in self.ALLOWED_TYPES:
                 raise ValidationError(self.INVALID_TYPE_MESSAGE)
+            if header_extension is None:
+                self.validate_declared_content_type(declared_mime_type, file_extension)
 
             complete_file_name = file_name + "." + file_extension
-            data = SimpleUploadedFile(
-                name=complete_file_name,
-                content=decoded_file,
-                content_type=file_mime_type
-            )
 
-            return super().to_internal_value(data)
+            if isinstance(decoded_file, TemporaryUploadedFile):
+                decoded_file.name = complete_file_name
+                decoded_file.seek(0)
+                data = decoded_file
+            else:
+                data = SimpleUploadedFile(
+                    name=complete_file_name,
+                    content=decoded_file,
+                    content_type=file_mime_type
+                )
+
+            validated_file = self.validate_file(data)
+            # Don't store the same content twice, refer to the stored file.
+            stored_name = self.get_stored_name(validated_file.name)
+            if stored_name is not None:
+                return StoredFile(validated_file, stored_name, self.get_storage())
+            return validated_file
 
         raise ValidationError(_(f"Invalid type. This is not an base64 string: {type(base64_data)}"))
 
+    async def ato_internal_value(self, base64_data):
+        """
+        Async variant of `to_internal_value` for ASGI deployments, decoding on
+        the thread pool of `get_base64_executor()` instead of the event loop.
+        """
+        return await run_in_base64_executor(self.to_internal_value, base64_data)
+
+    def to_internal_values(self, data_list, executor=None):
+        """
+        Run `to_internal_value` on every item of `data_list`, in parallel on
+        `executor` (a `concurrent.futures.Executor`) if given. Return the
+        validated values along with a dict of validation errors by index.
+        """
+        if executor is not None:
+            # Error messages are translated in the worker threads.
+            get_batch_result = functools.partial(call_in_language, translation.get_language(), self.get_batch_result)
+            results = executor.map(get_batch_result, data_list)
+        else:
+            results = map(self.get_batch_result, data_list)
+        values, errors = [], {}
+        for index, result in enumerate(results):
+            values.append(result.value)
+            if result.error is not None:
+                errors[index] = result.error
+        return values, errors
+
+    def get_batch_result(self, data):
+        try:
+            return Base64BatchResult(self.to_internal_value(data))
+        except (ValidationError, DRFValidationError) as exc:
+            return Base64BatchResult(None, exc)
+
+    def decode_to_temporary_file(self, base64_data, content_type=None):
+        """
+        Decode `base64_data` in chunks of `DECODE_CHUNK_SIZE` characters into a
+        `TemporaryUploadedFile`, the same way Django spools uploads larger
+        than `FILE_UPLOAD_MAX_MEMORY_SIZE` to disk.
+        """
+        temporary_file = TemporaryUploadedFile(name="base64", content_type=content_type, size=None, charset=None)
+        content_hash = hashlib.new(self.HASH_ALGORITHM) if self.content_addressed_names else None
+        try:
+            for chunk in iter_base64_decode(base64_data, self.DECODE_CHUNK_SIZE, self.urlsafe_base64):
+                temporary_file.write(chunk)
+                if content_hash is not None:
+                    content_hash.update(chunk)
+        except Exception:
+            temporary_file.close()
+            raise
+        temporary_file.size = temporary_file.tell()
+        if content_hash is not None:
+            temporary_file.content_hash = content_hash.hexdigest()
+        temporary_file.seek(0)
+        return temporary_file
+
+    def save_to_storage(self, base64_data, file_extension):
+        """
+        Decode `base64_data` in chunks of `DECODE_CHUNK_SIZE` characters
+        straight into the storage and return the stored name. Storages read
+        the decoded stream in chunks, e.g. for multipart uploads, so the
+        decoded file is never held in memory or on local disk.
+        """
+        # Decode the payload once before writing anything, discarding the
+        # output, so that decoding can't fail halfway through the write and
+        # leave a partial file under a name picked by the storage. With
+        # `content_addressed_names`, this pass also hashes the content, as
+        # the name has to be known before writing.
+        content_hash = hashlib.new(self.HASH_ALGORITHM) if self.content_addressed_names else None
+        decoded_size = 0
+        try:
+            for chunk in iter_base64_decode(base64_data, self.DECODE_CHUNK_SIZE, self.urlsafe_base64):
+                decoded_size += len(chunk)
+                if content_hash is not None:
+                    content_hash.update(chunk)
+        except (TypeError, binascii.Error, ValueError):
+            raise ValidationError(self.INVALID_FILE_MESSAGE)
+
+        reader = Base64DecodingReader(base64_data, self.DECODE_CHUNK_SIZE, self.urlsafe_base64)
+        if content_hash is not None:
+            reader.content_hash = content_hash.hexdigest()
+        complete_file_name = self.get_file_name(reader) + "." + file_extension
+        stored_name = self.get_stored_name(complete_file_name)
+        if stored_name is not None:
+            return stored_name
+
+        name = posixpath.join(self.upload_to, complete_file_name)
+        file = File(io.BufferedReader(reader), name=complete_file_name)
+        # The stream can't seek, so its size can't be found by seeking to its end.
+        file.size = decoded_size
+        return self.get_storage().save(name, file)
+
+    def validate_file(self, file):
+        """
+        Run the validation of the underlying file field on the decoded file.
+        """
+        return super().to_internal_value(file)
+
+    def validate_declared_content_type(self, mime_type, extension):
+        """
+        With `validate_content_type`, reject files whose type doesn't match
+        the MIME type declared in their data URI header. MIME types unknown
+        to `mimetypes` aren't checked.
+        """
+        if not self.validate_content_type or mime_type is None:
+            return
+        extensions = mimetypes.guess_all_extensions(mime_type, strict=False)
+        if extensions and "." + extension not in extensions:
+            raise ValidationError(self.CONTENT_TYPE_MISMATCH_MESSAGE)
+
+    def get_header_extension(self, decoded_header):
+        """
+        Guess the file extension from the first decoded bytes of the payload.
+        Return `None` if the type can't be determined from the header alone.
+        """
+        return None
+
     def get_file_extension(self, filename, decoded_file):
         raise NotImplementedError
 
+    def get_file_version(self, file):
+        """
+        Return a value that changes whenever the content stored under
+        `file.name` does. Override to use e.g. an ETag of the storage backend.
+        """
+        try:
+            modified_time = file.storage.get_modified_time(file.name)
+        except (NotImplementedError, OSError):
+            modified_time = None
+        return file.size, modified_time
+
+    def get_representation_cache_key(self, file):
+        """
+        Return the `representation_cache` key of `file`, or `None` if it can't
+        be cached because it isn't backed by a storage.
+        """
+        storage = getattr(file, "storage", None)
+        name = getattr(file, "name", None)
+        if storage is None or not name:
+            return None
+        storage_id = (type(storage).__module__, type(storage).__qualname__, getattr(storage, "location", None))
+        return storage_id, name, self.get_file_version(file)
+
     def get_file_name(self, decoded_file):
+        if self.content_addressed_names:
+            # Payloads that aren't decoded into memory are hashed up front.
+            content_hash = getattr(decoded_file, "content_hash", None)
+            return content_hash or hashlib.new(self.HASH_ALGORITHM, decoded_file).hexdigest()
         return str(uuid.uuid4())
 
+    def get_stored_name(self, file_name):
+        """
+        With `content_addressed_names` and a `storage`, return the storage
+        name of an already stored file with the same content, so that it
+        isn't written again, see `StoredFile`.
+        """
+        storage = self.get_storage()
+        if not self.content_addressed_names or storage is None:
+            return None
+        name = posixpath.join(self.upload_to, file_name)
+        return name if storage.exists(name) else None
+
+    def get_storage(self):
+        """
+        Return the storage files are written to or looked up in, which
+        defaults to `default_storage` with `write_to_storage`.
+        """
+        if self.storage is None and self.write_to_storage:
+            return default_storage
+        return self.storage
+
+    @instrumented
     def to_representation(self, file):
         if self.represent_in_base64:
             # If the underlying ImageField is blank, a ValueError would be
@@ -102,14 +734,33 @@ class Base64FieldMixin:
             if not file:
                 return ""
 
-            try:
-                with file.open() as f:
-                    return base64.b64encode(f.read()).decode()
-            except Exception:
-                raise OSError("Error encoding file")
+            representation = LazyBase64String(file, self.ENCODE_CHUNK_SIZE)
+            if self.representation_cache is not None:
+                cache_key = self.get_representation_cache_key(file)
+                if cache_key is not None:
+                    cached = self.representation_cache.get(cache_key)
+                    if listeners:
+                        emit(FieldEvent(self, "representation_cache", cache_hit=cached is not None))
+                    if cached is None:
+                        cached = str(representation)
+                        self.representation_cache.set(cache_key, cached)
+                    return cached
+
+            if self.lazy_representation:
+                return representation
+            return str(representation)
         else:
             return super().to_representation(file)
 
+    async def ato_representation(self, file):
+        """
+        Async variant of `to_representation`, reading and encoding the file on
+        the thread pool of `get_base64_executor()` instead of the event loop.
+        """
+        if self.represent_in_base64:
+            return await run_in_base64_executor(self.to_representation, file)
+        return self.to_representation(file)
+
 
 class Base64ImageField(Base64FieldMixin, ImageField):
     """
@@ -125,7 +776,42 @@ class Base64ImageField(Base64FieldMixin, ImageField):
     )
     INVALID_FILE_MESSAGE = _("Please upload a valid image.")
     INVALID_TYPE_MESSAGE = _("The type of the image couldn't be determined.")
+    MAX_WIDTH_MESSAGE = _("Ensure the image is at most {max_width} pixels wide.")
+    MAX_HEIGHT_MESSAGE = _("Ensure the image is at most {max_height} pixels high.")
+    MAX_PIXELS_MESSAGE = _("Ensure the image has at most {max_pixels} pixels.")
 
+    def __init__(self, *args, **kwargs):
+        self.max_width = kwargs.pop("max_width", None)
+        self.max_height = kwargs.pop("max_height", None)
+        self.max_pixels = kwargs.pop("max_pixels", None)
+        self.resize_to = kwargs.pop("resize_to", None)
+        self.output_format = kwargs.pop("output_format", None)
+        self.output_quality = kwargs.pop("output_quality", None)
+        self.strip_exif = kwargs.pop("strip_exif", False)
+        self.renditions = kwargs.pop("renditions", None)
+        self.representation_rendition = kwargs.pop("representation_rendition", None)
+        super().__init__(*args, **kwargs)
+        if self.write_to_storage:
+            # Streamed payloads are never decoded as images, so these options
+            # couldn't be applied to them.
+            options = [
+                option for option in (
+                    "max_width", "max_height", "max_pixels", "resize_to", "output_format", "output_quality",
+                    "strip_exif", "renditions",
+                )
+                if getattr(self, option)
+            ]
+            if options:
+                raise ImproperlyConfigured("{name} can't combine write_to_storage with {options}.".format(
+                    name=self.__class__.__name__, options=", ".join(options)
+                ))
+
+    @instrumented
+    def get_header_extension(self, decoded_header):
+        extension = filetype.guess_extension(decoded_header)
+        return "jpg" if extension == "jpeg" else extension
+
+    @instrumented(input_argument=1)
     def get_file_extension(self, filename, decoded_file):
         extension = filetype.guess_extension(decoded_file)
         if extension is None:
@@ -133,7 +819,7 @@ class Base64ImageField(Base64FieldMixin, ImageField):
                 # Try with PIL as fallback if format not detected
                 # with `filetype` module
                 from PIL import Image
-                image = Image.open(io.BytesIO(decoded_file))
+                image = Image.open(decoded_file if hasattr(decoded_file, "read") else io.BytesIO(decoded_file))
             except (ImportError, OSError):
                 raise ValidationError(self.INVALID_FILE_MESSAGE)
             else:
@@ -141,6 +827,183 @@ class Base64ImageField(Base64FieldMixin, ImageField):
 
         return "jpg" if extension == "jpeg" else extension
 
+    @instrumented
+    def validate_file(self, file):
+        """
+        Validate the image with a single Pillow pass on the decoded file
+        itself, instead of letting Django's `forms.ImageField` copy it into a
+        new buffer and parse it again. As in Django, the verified image is
+        attached as `file.image` and `file.content_type` is set from its format.
+        """
+        file = FileField.to_internal_value(self, file)
+        try:
+            from PIL import Image
+            image = Image.open(file)
+        except Exception:
+            self.fail("invalid_image")
+
+        # `Image.open` only parses the header, so the dimensions are checked
+        # before any pixel data is read.
+        self.validate_image_size(image)
+        try:
+            # verify() must be called immediately after the constructor.
+            image.verify()
+        except Exception:
+            self.fail("invalid_image")
+
+        file.image = image
+        file.content_type = Image.MIME.get(image.format)
+        file.seek(0)
+        validate_image_file_extension(file)
+        processed_image = None
+        if self.resize_to is not None or self.output_format is not None or self.strip_exif:
+            processed_file = self.process_image(file)
+            # Unprocessed images, e.g. animations, are only verified, and
+            # verified images can't be used anymore.
+            if processed_file is not file:
+                file, processed_image = processed_file, processed_file.image
+        if self.renditions:
+            file.renditions = self.create_renditions(file, processed_image)
+        return file
+
+    @instrumented
+    def process_image(self, file):
+        """
+        Downscale the image to fit in `resize_to`, and re-encode it in
+        `output_format` (the original format by default) at `output_quality`.
+        Metadata like EXIF isn't carried over to the re-encoded image.
+        """
+        from PIL import Image, ImageOps
+
+        try:
+            image = Image.open(file)
+            # Re-encoding would only keep the first frame of animations.
+            if getattr(image, "is_animated", False):
+                return file
+
+            output_format = (self.output_format or image.format).upper()
+            if output_format == "JPG":
+                output_format = "JPEG"
+            if self.resize_to is not None:
+                # Let JPEG images be decoded at a reduced scale right away.
+                image.draft("RGB", self.resize_to)
+            image = ImageOps.exif_transpose(image)
+            if self.resize_to is not None:
+                image.thumbnail(self.resize_to)
+            if output_format == "JPEG" and image.mode not in ("L", "RGB"):
+                image = image.convert("RGB")
+
+            save_kwargs = {}
+            if self.output_quality is not None:
+                save_kwargs["quality"] = self.output_quality
+            output = io.BytesIO()
+            image.save(output, format=output_format, **save_kwargs)
+        except Exception:
+            # `verify()` barely checks the pixel data, e.g. of truncated
+            # JPEG images, which only fail once they are decoded here.
+            self.fail("invalid_image")
+        image.format = output_format
+
+        extension = "jpg" if output_format == "JPEG" else output_format.lower()
+        processed_file = SimpleUploadedFile(
+            name=posixpath.splitext(file.name)[0] + "." + extension,
+            content=output.getvalue(),
+            content_type=Image.MIME.get(output_format),
+        )
+        processed_file.image = image
+        return processed_file
+
+    @instrumented
+    def create_renditions(self, file, image=None):
+        """
+        Create the `renditions` of the image, e.g.
+        `{"thumbnail": {"size": (128, 128), "format": "webp", "quality": 80}}`,
+        all from a single decode of `file` (or from the already decoded
+        `image`). Return a dict of the rendition files by name.
+        """
+        from PIL import Image, ImageOps
+
+        try:
+            if image is None:
+                image = Image.open(file)
+                image.draft("RGB", (
+                    max(spec["size"][0] for spec in self.renditions.values()),
+                    max(spec["size"][1] for spec in self.renditions.values()),
+                ))
+                source_format = image.format
+                image = ImageOps.exif_transpose(image)
+                image.load()
+                file.seek(0)
+            else:
+                source_format = image.format
+        except Exception:
+            # E.g. truncated images, which pass `verify()`.
+            self.fail("invalid_image")
+
+        renditions = {}
+        for rendition, spec in self.renditions.items():
+            output_format = self.get_rendition_format(rendition, source_format)
+            save_kwargs = {"quality": spec["quality"]} if "quality" in spec else {}
+            output = io.BytesIO()
+            try:
+                rendition_image = image.copy()
+                rendition_image.thumbnail(spec["size"])
+                if output_format == "JPEG" and rendition_image.mode not in ("L", "RGB"):
+                    rendition_image = rendition_image.convert("RGB")
+                rendition_image.save(output, format=output_format, **save_kwargs)
+            except Exception:
+                self.fail("invalid_image")
+            renditions[rendition] = SimpleUploadedFile(
+                name=self.get_rendition_name(file.name, rendition, source_format),
+                content=output.getvalue(),
+                content_type=Image.MIME.get(output_format),
+            )
+        return renditions
+
+    def get_rendition_format(self, rendition, source_format):
+        output_format = self.renditions[rendition].get("format", source_format).upper()
+        return "JPEG" if output_format == "JPG" else output_format
+
+    def get_rendition_name(self, name, rendition, source_format=None):
+        """
+        Return the storage name of `rendition` of the image stored as `name`.
+        """
+        base_name, extension = posixpath.splitext(name)
+        if source_format is None:
+            source_format = extension[1:]
+        output_format = self.get_rendition_format(rendition, source_format)
+        return "{}_{}.{}".format(base_name, rendition, "jpg" if output_format == "JPEG" else output_format.lower())
+
+    def save_renditions(self, field_file, renditions):
+        """
+        Save `renditions`, as returned on the validated file, next to the
+        saved `field_file` so that `representation_rendition` can find them.
+        """
+        for rendition, rendition_file in renditions.items():
+            field_file.storage.save(self.get_rendition_name(field_file.name, rendition), rendition_file)
+
+    def to_representation(self, file):
+        if self.representation_rendition is not None and file:
+            # Files stored without renditions, e.g. before they were enabled
+            # or through multipart uploads, are represented as they are when
+            # the file is read anyway. URLs are built without a storage call
+            # per row, so renditions have to be stored for every file.
+            rendition_name = self.get_rendition_name(file.name, self.representation_rendition)
+            if not self.represent_in_base64 or file.storage.exists(rendition_name):
+                file = type(file)(file.instance, file.field, rendition_name)
+        return super().to_representation(file)
+
+    def validate_image_size(self, image):
+        if self.max_width is None and self.max_height is None and self.max_pixels is None:
+            return
+        width, height = image.size
+        if self.max_width is not None and width > self.max_width:
+            raise ValidationError(str(self.MAX_WIDTH_MESSAGE).format(max_width=self.max_width))
+        if self.max_height is not None and height > self.max_height:
+            raise ValidationError(str(self.MAX_HEIGHT_MESSAGE).format(max_height=self.max_height))
+        if self.max_pixels is not None and width * height > self.max_pixels:
+            raise ValidationError(str(self.MAX_PIXELS_MESSAGE).format(max_pixels=self.max_pixels))
+
 
 class HybridImageField(Base64ImageField):
     """
@@ -150,14 +1013,20 @@ class HybridImageField(Base64ImageField):
 
     def to_internal_value(self, data):
         """
-        Try Base64Field first, and then try the ImageField
-        ``to_internal_value``, MRO doesn't work here because
-        Base64FieldMixin throws before ImageField can run.
+        Strings (and empty values) are handled by Base64Field, anything else,
+        e.g. an `UploadedFile` from a multipart request, by the ImageField
+        ``to_internal_value``. MRO doesn't work here because Base64FieldMixin
+        throws before ImageField can run. Dispatching on the input type means
+        the errors of the matching branch are the ones reported.
         """
-        try:
+        if isinstance(data, BASE64_INPUT_TYPES + (Base64BatchResult,)) or data in self.EMPTY_VALUES:
             return Base64FieldMixin.to_internal_value(self, data)
-        except ValidationError:
-            return ImageField.to_internal_value(self, data)
+        file = ImageField.to_internal_value(self, data)
+        # Django only verified the image, its pixel data isn't loaded yet.
+        image = getattr(file, "image", None)
+        if image is not None:
+            self.validate_image_size(image)
+        return file
 
 
 class Base64FileField(Base64FieldMixin, FileField):
@@ -173,17 +1042,154 @@ class Base64FileField(Base64FieldMixin, FileField):
     INVALID_FILE_MESSAGE = _("Please upload a valid file.")
     INVALID_TYPE_MESSAGE = _("The type of the file couldn't be determined.")
 
+    @instrumented
+    def get_header_extension(self, decoded_header):
+        return get_file_type_detector(self.ALLOWED_TYPES).detect(decoded_header)
+
+    @instrumented(input_argument=1)
     def get_file_extension(self, filename, decoded_file):
-        raise NotImplementedError('Implement file validation and return matching extension.')
+        """
+        Detect which of `ALLOWED_TYPES` the file is from its magic signature,
+        see `drf_extra_fields.file_types` to register more types. Override
+        for further validation of the file contents.
+        """
+        detector = get_file_type_detector(self.ALLOWED_TYPES)
+        if hasattr(decoded_file, "read"):
+            header = decoded_file.read(detector.header_size)
+            decoded_file.seek(0)
+        else:
+            header = decoded_file[:detector.header_size]
+        return detector.detect(header)
+
+
+class Base64ListSerializer(ListSerializer):
+    """
+    A `ListSerializer` that decodes and validates the base64 fields of all
+    items up front on a thread pool, before validating each item. Use it as
+    `Meta.list_serializer_class` of a serializer with base64 fields.
+    """
+    # The bounded pool of `get_base64_executor()` is shared by default. Set
+    # `executor` to another `concurrent.futures.Executor` instance, or
+    # `executor_class` (and `max_workers`) to create a pool for every call.
+    executor = None
+    executor_class = None
+    max_workers = None
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            data = self.run_base64_batch_validation(data)
+        return super().to_internal_value(data)
+
+    def get_executor(self):
+        """
+        Return a context manager of the executor the base64 fields are
+        decoded on, which only shuts down pools created for the call.
+        """
+        if self.executor_class is not None:
+            return self.executor_class(max_workers=self.max_workers)
+        return contextlib.nullcontext(self.executor or get_base64_executor())
+
+    def run_base64_batch_validation(self, data):
+        fields = [
+            field for field in self.child.fields.values()
+            if isinstance(field, Base64FieldMixin) and not field.read_only
+        ]
+        if not fields:
+            return data
+
+        # Copy the items so that the initial data isn't modified.
+        data = [dict(item) if isinstance(item, dict) else item for item in data]
+        with self.get_executor() as executor:
+            for field in fields:
+                indexes = [
+                    index for index, item in enumerate(data)
+                    if isinstance(item, dict) and isinstance(item.get(field.field_name), BASE64_INPUT_TYPES)
+                ]
+                values, errors = field.to_internal_values(
+                    [data[index][field.field_name] for index in indexes], executor
+                )
+                for position, index in enumerate(indexes):
+                    data[index][field.field_name] = Base64BatchResult(values[position], errors.get(position))
+        return data
+
+
+# `format` of range fields represented as PostgreSQL range literals, e.g.
+# "[2024-01-01,2024-02-01)". ISO_8601 represents them as "start/end".
+RANGE_LITERAL = "literal"
+
+# A PostgreSQL range literal, bounds are either double quoted or free of
+# quotes and commas. Empty bounds are unbounded.
+RANGE_LITERAL_PATTERN = re.compile(
+    r'\s*(?P<lower_inc>[\[(])'
+    r'\s*(?P<lower>"(?:[^"\\]|\\.)*"|[^,"]*?)\s*,'
+    r'\s*(?P<upper>"(?:[^"\\]|\\.)*"|[^,"]*?)\s*'
+    r'(?P<upper_inc>[\])])\s*'
+)
+RANGE_LITERAL_ESCAPE = re.compile(r'\\(.)')
+RANGE_LITERAL_SPECIAL_CHARACTERS = re.compile(r'[\s,()\[\]"\\]')
+
+# An ISO 8601 interval of a start and an end, ".." or nothing for no bound.
+ISO_8601_INTERVAL_PATTERN = re.compile(r"\s*(?P<lower>[^/\s]*)\s*/\s*(?P<upper>[^/\s]*)\s*")
+
+
+RANGE_KEYS = frozenset(("lower", "upper", "bounds", "empty"))
+
+
+def quote_range_bound(bound):
+    if bound is None:
+        return ""
+    bound = str(bound)
+    if not bound or RANGE_LITERAL_SPECIAL_CHARACTERS.search(bound):
+        return '"' + bound.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return bound
+
+
+def unquote_range_bound(bound):
+    if not bound:
+        return None
+    if bound[0] == '"':
+        return RANGE_LITERAL_ESCAPE.sub(r"\1", bound[1:-1])
+    return bound
+
+
+def get_range_bounds(value, discrete_step=None):
+    """
+    Return the `(lower, lower_inc, upper, upper_inc)` bounds of the range
+    `value`, unbounded sides being exclusive, or `None` if it's empty. With
+    `discrete_step`, the distance between consecutive values of a discrete
+    range type, the bounds are canonicalized to `[)` like PostgreSQL does.
+    """
+    if value.isempty:
+        return None
+    lower, upper = value.lower, value.upper
+    lower_inc = lower is not None and value.lower_inc
+    upper_inc = upper is not None and value.upper_inc
+    if discrete_step is not None:
+        if lower is not None and not lower_inc:
+            lower, lower_inc = lower + discrete_step, True
+        if upper is not None and upper_inc:
+            upper, upper_inc = upper + discrete_step, False
+    if lower is not None and upper is not None and (
+        lower > upper or (lower == upper and not (lower_inc and upper_inc))
+    ):
+        return None
+    return lower, lower_inc, upper, upper_inc
 
 
 class RangeField(DictField):
     range_type = None
+    # Types of bounds that are already validated data of the child field.
+    native_bound_types = ()
+    # Distance between consecutive values of discrete range types, see
+    # `get_range_bounds`.
+    discrete_step = None
 
     default_error_messages = dict(DictField.default_error_messages)
     default_error_messages.update({
         'too_much_content': _('Extra content not allowed "{extra}".'),
         'bound_ordering': _('The start of the range must not exceed the end of the range.'),
+        'invalid_literal': _('Expected a range literal like "[lower,upper)" but got "{input}".'),
+        'invalid_interval': _('Expected an ISO 8601 interval like "start/end" but got "{input}".'),
     })
 
     def __init__(self, **kwargs):
@@ -193,13 +1199,24 @@ class RangeField(DictField):
             )
 
         self.child_attrs = kwargs.pop("child_attrs", {})
+        self.format = kwargs.pop("format", None)
+        assert self.format in (None, RANGE_LITERAL, ISO_8601), (
+            "`format` of {name} must be None, {literal!r} or {iso_8601!r}".format(
+                name=self.__class__.__name__, literal=RANGE_LITERAL, iso_8601=ISO_8601
+            )
+        )
         self.child = self.child_class(**self.default_child_attrs, **self.child_attrs)
+        # Set by `RangeListSerializer` while it represents a list of rows.
+        self.bound_representer = None
         super().__init__(**kwargs)
 
+    @instrumented
     def to_internal_value(self, data):
         """
         Range instances <- Dicts of primitive datatypes.
         """
+        if self.format is not None and isinstance(data, str):
+            return self.parse_range(data)
         if html.is_html_input(data):
             data = html.parse_html_dict(data)
         if not isinstance(data, dict):
@@ -209,8 +1226,8 @@ class RangeField(DictField):
         if hasattr(self, "allow_empty") and not self.allow_empty and len(data) == 0:
             self.fail('empty')
 
-        extra_content = list(set(data) - {"lower", "upper", "bounds", "empty"})
-        if extra_content:
+        if not RANGE_KEYS.issuperset(data):
+            extra_content = [key for key in data if key not in RANGE_KEYS]
             self.fail('too_much_content', extra=', '.join(map(str, extra_content)))
 
         validated_dict = {}
@@ -220,7 +1237,7 @@ class RangeField(DictField):
             except KeyError:
                 continue
 
-            validated_dict[str(key)] = self.child.run_validation(value)
+            validated_dict[key] = self.validate_bound(value)
 
         lower, upper = validated_dict.get('lower'), validated_dict.get('upper')
         if lower is not None and upper is not None and lower > upper:
@@ -232,10 +1249,55 @@ class RangeField(DictField):
             except KeyError:
                 continue
 
-            validated_dict[str(key)] = value
+            validated_dict[key] = value
 
         return self.range_type(**validated_dict)
 
+    def validate_bound(self, value):
+        """
+        Validate a single bound with the child field. Bounds that already are
+        of one of the `native_bound_types` skip the conversion from primitive
+        datatypes, only the validators of the child field are run on them.
+        """
+        if type(value) in self.native_bound_types:
+            value = self.convert_native_bound(value)
+            self.child.run_validators(value)
+            return value
+        return self.child.run_validation(value)
+
+    def convert_native_bound(self, value):
+        return value
+
+    def parse_range(self, data):
+        """
+        Range instances <- range literals or ISO 8601 intervals.
+        """
+        if data.strip().lower() == "empty":
+            return self.range_type(empty=True)
+        match = None
+        if self.format == ISO_8601:
+            match = ISO_8601_INTERVAL_PATTERN.fullmatch(data)
+            if match is not None:
+                lower, upper = (None if bound in ("", "..") else bound for bound in match.groups())
+                bounds = "[)"
+        if match is None:
+            # Ranges that intervals can't express are represented, and so
+            # accepted, as range literals in the ISO 8601 format too.
+            match = RANGE_LITERAL_PATTERN.fullmatch(data)
+            if match is None:
+                self.fail('invalid_literal' if self.format == RANGE_LITERAL else 'invalid_interval', input=data)
+            lower, upper = unquote_range_bound(match["lower"]), unquote_range_bound(match["upper"])
+            bounds = match["lower_inc"] + match["upper_inc"]
+
+        if lower is not None:
+            lower = self.validate_bound(lower)
+        if upper is not None:
+            upper = self.validate_bound(upper)
+        if lower is not None and upper is not None and lower > upper:
+            self.fail('bound_ordering')
+        return self.range_type(lower, upper, bounds)
+
+    @instrumented
     def to_representation(self, value):
         """
         Range instances -> dicts of primitive datatypes.
@@ -249,14 +1311,45 @@ class RangeField(DictField):
             bounds = value.get("bounds")
         else:
             if value.isempty:
-                return {'empty': True}
+                return {'empty': True} if self.format is None else "empty"
             lower = value.lower
             upper = value.upper
             bounds = value._bounds
 
-        return {'lower': self.child.to_representation(lower) if lower is not None else None,
-                'upper': self.child.to_representation(upper) if upper is not None else None,
-                'bounds': bounds}
+        output_format = self.format
+        if output_format == ISO_8601:
+            # Intervals are parsed as `[)` ranges, so discrete ranges are
+            # canonicalized to `[)` first. Continuous ranges with other bounds
+            # can't be intervals, they are represented as range literals.
+            range_bounds = get_range_bounds(self.range_type(lower, upper, bounds or "[)"), self.discrete_step)
+            if range_bounds is None:
+                return "empty"
+            lower, lower_inc, upper, upper_inc = range_bounds
+            bounds = ("[" if lower_inc else "(") + ("]" if upper_inc else ")")
+            if (lower is not None and not lower_inc) or upper_inc:
+                output_format = RANGE_LITERAL
+
+        represent_bound = self.bound_representer or self.get_bound_representer()
+        lower = represent_bound(lower) if lower is not None else None
+        upper = represent_bound(upper) if upper is not None else None
+        if output_format == RANGE_LITERAL:
+            bounds = bounds or "[)"
+            # Unbounded sides are exclusive, as PostgreSQL and psycopg 3 have them.
+            return (
+                (bounds[0] if lower is not None else "(") + quote_range_bound(lower) + ","
+                + quote_range_bound(upper) + (bounds[1] if upper is not None else ")")
+            )
+        if output_format == ISO_8601:
+            return "{}/{}".format(".." if lower is None else lower, ".." if upper is None else upper)
+        return {'lower': lower, 'upper': upper, 'bounds': bounds}
+
+    def get_bound_representer(self):
+        """
+        Return a callable representing a single bound. Subclasses can make the
+        decisions that don't depend on the bound (output format, timezone)
+        once here, instead of once per bound.
+        """
+        return self.child.to_representation
 
     def get_initial(self):
         initial = super().get_initial()
@@ -267,30 +1360,295 @@ class IntegerRangeField(RangeField):
     child_class = IntegerField
     default_child_attrs = {}
     range_type = NumericRange
+    native_bound_types = (int,)
+    discrete_step = 1
 
 
 class FloatRangeField(RangeField):
     child_class = FloatField
     default_child_attrs = {}
     range_type = NumericRange
+    native_bound_types = (float,)
+
+    def convert_native_bound(self, value):
+        if not math.isfinite(value):
+            return self.child.to_internal_value(value)
+        return value
 
 
 class DecimalRangeField(RangeField):
     child_class = DecimalField
     default_child_attrs = {"max_digits": None, "decimal_places": None}
     range_type = NumericRange
+    native_bound_types = (decimal.Decimal,)
+
+    def convert_native_bound(self, value):
+        # Precision limits and infinite values are left to the child field.
+        child = self.child
+        if child.max_digits is not None or child.decimal_places is not None or not value.is_finite():
+            return child.to_internal_value(value)
+        return value
 
 
 class DateTimeRangeField(RangeField):
     child_class = DateTimeField
     default_child_attrs = {}
     range_type = DateTimeTZRange
+    native_bound_types = (datetime.datetime,)
+
+    def convert_native_bound(self, value):
+        return self.child.enforce_timezone(value)
+
+    def get_bound_representer(self):
+        child = self.child
+        output_format = getattr(child, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None:
+            return child.to_representation
+        field_timezone = child.timezone if hasattr(child, "timezone") else child.default_timezone()
+        iso_8601 = output_format.lower() == ISO_8601
+
+        def represent_bound(value):
+            if isinstance(value, str):
+                return value
+            if value.utcoffset() is None:
+                if field_timezone is not None:
+                    value = child.enforce_timezone(value)
+            elif field_timezone is not None:
+                try:
+                    value = value.astimezone(field_timezone)
+                except OverflowError:
+                    child.fail("overflow")
+            else:
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            if iso_8601:
+                value = value.isoformat()
+                return value[:-6] + "Z" if value.endswith("+00:00") else value
+            return value.strftime(output_format)
+
+        return represent_bound
 
 
 class DateRangeField(RangeField):
     child_class = DateField
     default_child_attrs = {}
     range_type = DateRange
+    native_bound_types = (datetime.date,)
+    discrete_step = datetime.timedelta(days=1)
+
+    def get_bound_representer(self):
+        output_format = getattr(self.child, "format", api_settings.DATE_FORMAT)
+        if output_format is None or output_format.lower() != ISO_8601:
+            return self.child.to_representation
+
+        def represent_bound(value):
+            if isinstance(value, str):
+                return value
+            assert not isinstance(value, datetime.datetime), (
+                "Expected a `date`, but got a `datetime`. Refusing to coerce, "
+                "as this may mean losing timezone information. Use a custom "
+                "read-only field and deal with timezone issues explicitly."
+            )
+            return value.isoformat()
+
+        return represent_bound
+
+
+class RangeListSerializer(ListSerializer):
+    """
+    A ListSerializer that makes the per-field decisions of the range fields
+    of its child, like their output format and timezone, once for the whole
+    list instead of once per bound. Use it as the `list_serializer_class`.
+    """
+
+    def to_representation(self, data):
+        range_fields = [field for field in self.child._readable_fields if isinstance(field, RangeField)]
+        for field in range_fields:
+            field.bound_representer = field.get_bound_representer()
+        try:
+            return super().to_representation(data)
+        finally:
+            for field in range_fields:
+                field.bound_representer = None
+
+
+class MultiRangeField(ListField):
+    """
+    A list of ranges of `child_class`, normalized on input by sorting and
+    merging the overlapping and adjacent ones, like PostgreSQL multiranges.
+    Validated data is a plain list of ranges, which `ArrayField`s of range
+    model fields save as is, unlike psycopg's `Multirange`.
+    """
+    child_class = None
+
+    def __init__(self, **kwargs):
+        if "child" not in kwargs:
+            kwargs["child"] = self.child_class(**kwargs.pop("child_attrs", {}))
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        return self.normalize_ranges(super().to_internal_value(data))
+
+    def to_representation(self, data):
+        child = self.child
+        child.bound_representer = child.get_bound_representer()
+        try:
+            return [child.to_representation(item) if item is not None else None for item in data]
+        finally:
+            child.bound_representer = None
+
+    def normalize_ranges(self, ranges):
+        """
+        Sort `ranges` by their lower bound and merge the overlapping and
+        adjacent ones in a single pass. Empty and null ranges are dropped,
+        discrete ones are canonicalized to `[)` bounds first.
+        """
+        range_type = self.child.range_type
+        discrete_step = self.child.discrete_step
+        bounds = [get_range_bounds(value, discrete_step) for value in ranges if value is not None]
+        bounds = [range_bounds for range_bounds in bounds if range_bounds is not None]
+
+        # Unbounded lower bounds first, then inclusive before exclusive ones.
+        bounds.sort(key=lambda bound: (bound[0] is not None, bound[0], not bound[1]))
+
+        merged = []
+        for lower, lower_inc, upper, upper_inc in bounds:
+            if merged:
+                last_lower, last_lower_inc, last_upper, last_upper_inc = merged[-1]
+                if last_upper is None or lower is None or lower < last_upper or (
+                    lower == last_upper and (last_upper_inc or lower_inc)
+                ):
+                    if last_upper is not None and (upper is None or upper > last_upper):
+                        last_upper, last_upper_inc = upper, upper_inc
+                    elif upper == last_upper:
+                        last_upper_inc = last_upper_inc or upper_inc
+                    merged[-1] = (last_lower, last_lower_inc, last_upper, last_upper_inc)
+                    continue
+            merged.append((lower, lower_inc, upper, upper_inc))
+
+        return [
+            range_type(lower, upper, ("[" if lower_inc else "(") + ("]" if upper_inc else ")"))
+            for lower, lower_inc, upper, upper_inc in merged
+        ]
+
+
+class IntegerMultiRangeField(MultiRangeField):
+    child_class = IntegerRangeField
+
+
+class FloatMultiRangeField(MultiRangeField):
+    child_class = FloatRangeField
+
+
+class DecimalMultiRangeField(MultiRangeField):
+    child_class = DecimalRangeField
+
+
+class DateTimeMultiRangeField(MultiRangeField):
+    child_class = DateTimeRangeField
+
+
+class DateMultiRangeField(MultiRangeField):
+    child_class = DateRangeField
+
+
+# Multirange fields of the range fields, see `MultiRangeModelSerializerMixin`.
+MULTIRANGE_FIELDS = {
+    IntegerRangeField: IntegerMultiRangeField,
+    FloatRangeField: FloatMultiRangeField,
+    DecimalRangeField: DecimalMultiRangeField,
+    DateTimeRangeField: DateTimeMultiRangeField,
+    DateRangeField: DateMultiRangeField,
+}
+
+
+class MultiRangeModelSerializerMixin:
+    """
+    A ModelSerializer mixin mapping `ArrayField`s of range model fields to
+    the multirange fields instead of plain `ListField`s of range fields.
+    """
+
+    def build_standard_field(self, field_name, model_field):
+        field_class, field_kwargs = super().build_standard_field(field_name, model_field)
+        child = field_kwargs.get("child")
+        if issubclass(field_class, ListField) and type(child) in MULTIRANGE_FIELDS:
+            field_class = MULTIRANGE_FIELDS[type(child)]
+        return field_class, field_kwargs
+
+
+def find_overlapping_ranges(ranges, discrete_step=None):
+    """
+    Return `(index, other_index)` pairs of overlapping `ranges`, so that the
+    index of every range overlapping another one is in at least one pair.
+    The ranges are sorted by their lower bound and swept once, keeping the
+    one reaching furthest so far, so it takes O(n log n) time. Pass the
+    `discrete_step` of discrete range types, e.g. 1 for integer ranges.
+    """
+    candidates = []
+    for index, value in enumerate(ranges):
+        range_bounds = get_range_bounds(value, discrete_step) if value is not None else None
+        if range_bounds is not None:
+            candidates.append(range_bounds + (index,))
+    # Unbounded lower bounds first, then inclusive before exclusive ones.
+    candidates.sort(key=lambda candidate: (candidate[0] is not None, candidate[0], not candidate[1]))
+
+    overlaps = []
+    reach = None
+    for lower, lower_inc, upper, upper_inc, index in candidates:
+        if reach is not None:
+            reach_upper, reach_upper_inc, reach_index = reach
+            if reach_upper is None or lower is None or lower < reach_upper or (
+                lower == reach_upper and reach_upper_inc and lower_inc
+            ):
+                overlaps.append((reach_index, index))
+                if reach_upper is None or (upper is not None and (
+                    upper < reach_upper or (upper == reach_upper and not upper_inc)
+                )):
+                    continue
+        reach = (upper, upper_inc, index)
+    return overlaps
+
+
+class NonOverlappingRangesValidator:
+    """
+    Validates that the ranges of a list don't overlap, e.g. as a validator
+    of a list serializer with the name of the range field in its rows, or
+    of a `ListField` of range fields without `field_name`. Integer and date
+    ranges are compared as discrete ranges, with the `discrete_step` of the
+    range field unless one is given.
+    """
+    message = _("The range at index {index} overlaps the range at index {other_index}.")
+    requires_context = True
+
+    def __init__(self, field_name=None, message=None, discrete_step=None):
+        self.field_name = field_name
+        self.message = message or self.message
+        self.discrete_step = discrete_step
+
+    def __call__(self, value, serializer_field=None):
+        if self.field_name is not None:
+            value = [item.get(self.field_name) for item in value]
+        overlaps = find_overlapping_ranges(value, self.get_discrete_step(serializer_field))
+        errors = [
+            str(self.message).format(index=max(pair), other_index=min(pair))
+            for pair in overlaps
+        ]
+        if errors:
+            raise DRFValidationError(errors, code="overlap")
+
+    def get_discrete_step(self, serializer_field):
+        """
+        Return `discrete_step`, or the one of the range field of the list
+        serializer or `ListField` being validated.
+        """
+        if self.discrete_step is not None:
+            return self.discrete_step
+        range_field = getattr(serializer_field, "child", None)
+        if self.field_name is not None:
+            range_field = getattr(range_field, "fields", {}).get(self.field_name)
+        return getattr(range_field, "discrete_step", None)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(field_name={self.field_name!r})>"
 
 
 if compat.postgres_fields:
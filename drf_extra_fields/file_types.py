@@ -0,0 +1,108 @@
+import threading
+
+# Magic signatures by file extension. Each signature is a tuple of
+# (offset, magic bytes) parts that all have to match.
+FILE_SIGNATURES = {
+    "7z": [((0, b"7z\xbc\xaf\x27\x1c"),)],
+    "bmp": [((0, b"BM"),)],
+    "gif": [((0, b"GIF87a"),), ((0, b"GIF89a"),)],
+    "gz": [((0, b"\x1f\x8b"),)],
+    "ico": [((0, b"\x00\x00\x01\x00"),)],
+    "jpeg": [((0, b"\xff\xd8\xff"),)],
+    "jpg": [((0, b"\xff\xd8\xff"),)],
+    "mp3": [((0, b"ID3"),), ((0, b"\xff\xfb"),)],
+    "mp4": [((4, b"ftypisom"),), ((4, b"ftypmp42"),), ((4, b"ftypMSNV"),)],
+    "ogg": [((0, b"OggS"),)],
+    "pdf": [((0, b"%PDF-"),)],
+    "png": [((0, b"\x89PNG\r\n\x1a\n"),)],
+    "rar": [((0, b"Rar!\x1a\x07"),)],
+    "tif": [((0, b"II*\x00"),), ((0, b"MM\x00*"),)],
+    "wav": [((0, b"RIFF"), (8, b"WAVE"))],
+    "webp": [((0, b"RIFF"), (8, b"WEBP"))],
+    "zip": [((0, b"PK\x03\x04"),), ((0, b"PK\x05\x06"),)],
+}
+
+# Callables taking the leading bytes of a file and returning whether it is
+# of the given extension, for types without a fixed signature.
+FILE_DETECTORS = {}
+
+detectors_cache = {}
+detectors_cache_lock = threading.Lock()
+
+
+def register_file_signature(extension, *parts):
+    """
+    Register a magic signature for `extension`, given as (offset, magic bytes)
+    parts that all have to match, e.g.
+    `register_file_signature("webp", (0, b"RIFF"), (8, b"WEBP"))`.
+    """
+    with detectors_cache_lock:
+        FILE_SIGNATURES.setdefault(extension, []).append(tuple(parts))
+        detectors_cache.clear()
+
+
+def register_file_detector(extension, detector):
+    """
+    Register a callable detecting files of `extension` from their leading
+    bytes, checked after the magic signatures.
+    """
+    with detectors_cache_lock:
+        FILE_DETECTORS.setdefault(extension, []).append(detector)
+        detectors_cache.clear()
+
+
+class FileTypeDetector:
+    """
+    Detects which of `extensions` a file is from its leading bytes, using a
+    table of their signatures indexed by first byte that is built once.
+    """
+    # Number of leading bytes passed to registered detectors.
+    DETECTOR_HEADER_SIZE = 512
+
+    def __init__(self, extensions):
+        self.signatures_by_first_byte = {}
+        self.other_signatures = []
+        self.detectors = []
+        # Number of leading bytes needed to detect any of the types.
+        self.header_size = 0
+        for extension in extensions:
+            for signature in FILE_SIGNATURES.get(extension, ()):
+                offset, magic = signature[0]
+                if offset == 0:
+                    self.signatures_by_first_byte.setdefault(magic[0], []).append((extension, signature))
+                else:
+                    self.other_signatures.append((extension, signature))
+                self.header_size = max([self.header_size] + [offset + len(magic) for offset, magic in signature])
+            for detector in FILE_DETECTORS.get(extension, ()):
+                self.detectors.append((extension, detector))
+                self.header_size = max(self.header_size, self.DETECTOR_HEADER_SIZE)
+
+    def detect(self, header):
+        """
+        Return the extension matching `header`, or `None` if there is none.
+        """
+        if not header:
+            return None
+        for extension, signature in self.signatures_by_first_byte.get(header[0], ()):
+            if all(header[offset:offset + len(magic)] == magic for offset, magic in signature):
+                return extension
+        for extension, signature in self.other_signatures:
+            if all(header[offset:offset + len(magic)] == magic for offset, magic in signature):
+                return extension
+        for extension, detector in self.detectors:
+            if detector(header):
+                return extension
+        return None
+
+
+def get_file_type_detector(extensions):
+    """
+    Return the `FileTypeDetector` of `extensions`, built once and cached until
+    another signature or detector is registered.
+    """
+    key = tuple(extensions)
+    with detectors_cache_lock:
+        detector = detectors_cache.get(key)
+        if detector is None:
+            detector = detectors_cache[key] = FileTypeDetector(key)
+        return detector
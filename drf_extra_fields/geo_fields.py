@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+from drf_extra_fields.instrumentation import instrumented
+
 EMPTY_VALUES = (None, '', [], (), {})
 
 
@@ -31,6 +33,7 @@ class PointField(serializers.Field):
         self.srid = kwargs.pop('srid', None)
         super().__init__(*args, **kwargs)
 
+    @instrumented
     def to_internal_value(self, value):
         """
         Parse json data and return a point object
@@ -56,6 +59,7 @@ class PointField(serializers.Field):
                 self.fail('invalid')
         self.fail('invalid')
 
+    @instrumented
     def to_representation(self, value):
         """
         Transform POINT object to json.
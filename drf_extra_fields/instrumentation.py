@@ -0,0 +1,172 @@
+import functools
+import logging
+import threading
+import time
+
+from django.core.files.uploadedfile import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+# Callables receiving a `FieldEvent` for every instrumented call. While it is
+# empty, instrumented methods skip all measurements.
+listeners = []
+listeners_lock = threading.Lock()
+
+
+def register_listener(listener):
+    """
+    Register a callable receiving a `FieldEvent` for every instrumented call.
+    Listeners are called synchronously, possibly from several threads, and
+    their exceptions are logged instead of propagated.
+    """
+    with listeners_lock:
+        if listener not in listeners:
+            listeners.append(listener)
+
+
+def unregister_listener(listener):
+    with listeners_lock:
+        if listener in listeners:
+            listeners.remove(listener)
+
+
+class FieldEvent:
+    """
+    A call of `operation` on `field`, taking `duration` seconds. Sizes are in
+    bytes (characters for str) and `None` when they aren't known up front.
+    """
+
+    def __init__(self, field, operation, start_time=None, duration=None, input_size=None, output_size=None,
+                 cache_hit=None, error=None):
+        self.field = field
+        self.operation = operation
+        # Wall-clock start of the call, in nanoseconds since the epoch.
+        self.start_time = start_time
+        self.duration = duration
+        self.input_size = input_size
+        self.output_size = output_size
+        self.cache_hit = cache_hit
+        self.error = error
+
+    @property
+    def name(self):
+        return f"{type(self.field).__name__}.{self.operation}"
+
+    @property
+    def reason(self):
+        """
+        Why the call failed: the code of its validation error if there is one,
+        otherwise its message or the name of the exception.
+        """
+        if self.error is None:
+            return None
+        get_codes = getattr(self.error, "get_codes", None)
+        codes = get_codes() if get_codes is not None else getattr(self.error, "code", None)
+        while isinstance(codes, (list, dict)) and codes:
+            codes = codes[0] if isinstance(codes, list) else next(iter(codes.values()))
+        if isinstance(codes, str):
+            return codes
+        messages = getattr(self.error, "messages", None)
+        if messages:
+            return str(messages[0])
+        return type(self.error).__name__
+
+
+def emit(event):
+    """
+    Send `event` to every listener. A failing listener is logged and skipped,
+    so that it can't fail the instrumented call or mask its own error.
+    """
+    for listener in list(listeners):
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Instrumentation listener %r failed on %s", listener, event.name)
+
+
+def get_size(value):
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, UploadedFile):
+        return value.size
+    return None
+
+
+def instrumented(method=None, *, input_argument=0, operation=None):
+    """
+    Report the calls of a field method to the registered listeners, along
+    with the sizes of its result and of its `input_argument`-th argument,
+    as `operation` (the method name by default).
+    """
+    if method is None:
+        return functools.partial(instrumented, input_argument=input_argument, operation=operation)
+    if operation is None:
+        operation = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(field, *args, **kwargs):
+        if not listeners:
+            return method(field, *args, **kwargs)
+        input_size = get_size(args[input_argument]) if len(args) > input_argument else None
+        start_time = time.time_ns()
+        start = time.perf_counter()
+        try:
+            result = method(field, *args, **kwargs)
+        except Exception as exc:
+            emit(FieldEvent(field, operation, start_time, time.perf_counter() - start, input_size, error=exc))
+            raise
+        emit(FieldEvent(
+            field, operation, start_time, time.perf_counter() - start, input_size, get_size(result)
+        ))
+        return result
+
+    return wrapper
+
+
+class OpenTelemetryListener:
+    """
+    Record events as OpenTelemetry spans, requires `opentelemetry-api`.
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+        self.tracer = tracer or trace.get_tracer("drf_extra_fields")
+        self.status = trace.Status
+        self.status_code = trace.StatusCode
+
+    def __call__(self, event):
+        attributes = {"drf_extra_fields.field": type(event.field).__name__}
+        for key in ("input_size", "output_size", "cache_hit"):
+            value = getattr(event, key)
+            if value is not None:
+                attributes["drf_extra_fields." + key] = value
+        span = self.tracer.start_span(event.name, start_time=event.start_time, attributes=attributes)
+        if event.error is not None:
+            span.set_status(self.status(self.status_code.ERROR, event.reason))
+        end_time = None if event.duration is None else event.start_time + int(event.duration * 1e9)
+        span.end(end_time=end_time)
+
+
+class StatsdListener:
+    """
+    Send events as statsd metrics through `client`, e.g. a `statsd.StatsClient`.
+    """
+
+    def __init__(self, client, prefix="drf_extra_fields"):
+        self.client = client
+        self.prefix = prefix
+
+    def __call__(self, event):
+        name = f"{self.prefix}.{event.name}"
+        if event.duration is not None:
+            self.client.timing(name, event.duration * 1000)
+        if event.input_size is not None:
+            self.client.incr(name + ".input_bytes", event.input_size)
+        if event.output_size is not None:
+            self.client.incr(name + ".output_bytes", event.output_size)
+        if event.cache_hit is not None:
+            self.client.incr(name + (".hits" if event.cache_hit else ".misses"))
+        if event.error is not None:
+            self.client.incr(name + ".errors")
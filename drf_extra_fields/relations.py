@@ -6,6 +6,8 @@ from rest_framework.relations import (
     ManyRelatedField as DRFManyRelatedField
 )
 
+from drf_extra_fields.instrumentation import instrumented
+
 
 class ReadSourceMixin:
     """
@@ -82,6 +84,7 @@ class PresentableRelatedFieldMixin(ReadSourceMixin):
 
         return OrderedDict([(item.pk, self.display_value(item)) for item in queryset])
 
+    @instrumented
     def to_representation(self, data):
         if isinstance(self.presentation_serializer, str):
             self.presentation_serializer = import_string(self.presentation_serializer)
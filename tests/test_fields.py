@@ -1,34 +1,77 @@
+import asyncio
 import base64
+import binascii
 import copy
 import datetime
+import hashlib
+import io
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from unittest.mock import patch
 
 import django
 import pytest
 import pytz
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from PIL import ImageFile
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.db.models import FileField as ModelFileField
+from django.db.models.fields.files import FieldFile
 from django.test import TestCase, override_settings
+from django.utils import translation
 from rest_framework import serializers
-from rest_framework.fields import DecimalField
+from rest_framework.renderers import JSONRenderer
+from rest_framework.fields import DecimalField, ImageField, IntegerField
 
-from drf_extra_fields import compat
+from drf_extra_fields import compat, fields, file_types
 from drf_extra_fields.compat import DateRange, DateTimeTZRange, NumericRange
 from drf_extra_fields.fields import (
     Base64FileField,
     Base64ImageField,
+    Base64ListSerializer,
+    Base64RepresentationCache,
     DateRangeField,
     DateTimeRangeField,
     DecimalRangeField,
     FloatRangeField,
     HybridImageField,
     IntegerRangeField,
+    LazyBase64String,
+    DateMultiRangeField,
+    DateTimeMultiRangeField,
+    IntegerMultiRangeField,
     LowercaseEmailField,
+    NonOverlappingRangesValidator,
+    RangeListSerializer,
+    StoredFile,
+    find_overlapping_ranges,
+    get_decoded_size,
+    get_range_bounds,
+    iter_base64_decode,
+    iter_base64_encode,
+    parse_data_uri_header,
+)
+from drf_extra_fields.file_types import (
+    FILE_DETECTORS,
+    FILE_SIGNATURES,
+    get_file_type_detector,
+    register_file_detector,
+    register_file_signature,
 )
 from drf_extra_fields.geo_fields import PointField
 
 
+def _image_bytes(size, format='PNG'):
+    from PIL import Image
+    output = io.BytesIO()
+    Image.new('RGB', size, (255, 0, 0)).save(output, format=format)
+    return output.getvalue()
+
+
 class UploadedBase64Image:
     def __init__(self, file=None, created=None):
         self.file = file
@@ -153,17 +196,33 @@ class Base64ImageSerializerTests(TestCase):
 
     def test_hybrid_image_field(self):
         field = HybridImageField()
+        for data in ('R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw==', {}):
+            with patch('drf_extra_fields.fields.Base64FieldMixin') as mixin_patch:
+                with patch('drf_extra_fields.fields.ImageField') as image_patch:
+                    field.to_internal_value(data)
+                    self.assertTrue(mixin_patch.to_internal_value.called)
+                    self.assertFalse(image_patch.to_internal_value.called)
+
+        uploaded_file = SimpleUploadedFile('image.gif', base64.b64decode(
+            'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='))
         with patch('drf_extra_fields.fields.Base64FieldMixin') as mixin_patch:
-            field.to_internal_value({})
-            self.assertTrue(mixin_patch.to_internal_value.called)
-
-        with patch('drf_extra_fields.fields.Base64FieldMixin') as mixin_patch:
-            mixin_patch.to_internal_value.side_effect = ValidationError('foobar')
             with patch('drf_extra_fields.fields.ImageField') as image_patch:
-                field.to_internal_value({})
-                self.assertTrue(mixin_patch.to_internal_value.called)
+                field.to_internal_value(uploaded_file)
+                self.assertFalse(mixin_patch.to_internal_value.called)
                 self.assertTrue(image_patch.to_internal_value.called)
 
+    def test_hybrid_image_field_reports_failing_branch(self):
+        field = HybridImageField()
+        with patch('drf_extra_fields.fields.ImageField') as image_patch:
+            with self.assertRaises(ValidationError) as context:
+                field.to_internal_value('this_is_not_a_base64')
+            self.assertFalse(image_patch.to_internal_value.called)
+        self.assertEqual(context.exception.messages, [HybridImageField.INVALID_FILE_MESSAGE])
+
+        with self.assertRaises(ValidationError) as context:
+            field.to_internal_value(SimpleUploadedFile('image.gif', b'not an image'))
+        self.assertEqual(context.exception.messages, [ImageField.default_error_messages['invalid_image']])
+
     def test_create_with_webp_image(self):
         """
         Test for creating Base64 image with webp format in the server side
@@ -178,6 +237,540 @@ class Base64ImageSerializerTests(TestCase):
         self.assertEqual(serializer.validated_data['created'], uploaded_image.created)
         self.assertFalse(serializer.validated_data is uploaded_image)
 
+    def test_spool_to_disk_over_max_memory_size(self):
+        """
+        Payloads larger than `max_memory_size` should be decoded into a temporary file
+        """
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField(max_memory_size=10)
+        field.DECODE_CHUNK_SIZE = 8
+        image = field.to_internal_value(file)
+        self.assertIsInstance(image, TemporaryUploadedFile)
+        self.assertTrue(image.name.endswith('.gif'))
+        self.assertEqual(image.read(), base64.b64decode(file))
+
+        image = Base64ImageField(max_memory_size=1024).to_internal_value(file)
+        self.assertNotIsInstance(image, TemporaryUploadedFile)
+
+    def test_spool_to_disk_with_invalid_base64(self):
+        field = Base64ImageField(max_memory_size=1)
+        with self.assertRaises(ValidationError):
+            field.to_internal_value('this_is_not_a_base64')
+
+    def test_iter_base64_decode(self):
+        encoded = base64.b64encode(os.urandom(1000)).decode()
+        wrapped = '\n'.join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+        for chunk_size in (4, 7, 64, 4096):
+            self.assertEqual(b''.join(iter_base64_decode(wrapped, chunk_size)), base64.b64decode(encoded))
+            self.assertEqual(b''.join(iter_base64_decode(memoryview(wrapped.encode()), chunk_size)),
+                             base64.b64decode(encoded))
+
+    def test_reject_disallowed_type_from_header(self):
+        """
+        Disallowed types should be rejected after decoding only the leading bytes
+        """
+        file = base64.b64encode(b'%PDF-1.4\n' + b'0' * 10000).decode()
+        field = Base64ImageField()
+        with patch('drf_extra_fields.fields.binascii.a2b_base64', wraps=binascii.a2b_base64) as a2b_base64_patch:
+            with self.assertRaises(ValidationError) as context:
+                field.to_internal_value(file)
+        self.assertEqual(context.exception.messages, [Base64ImageField.INVALID_TYPE_MESSAGE])
+        self.assertEqual(a2b_base64_patch.call_count, 1)
+        self.assertEqual(len(a2b_base64_patch.call_args[0][0]), Base64ImageField.HEADER_CHUNK_SIZE)
+
+    def test_single_pillow_pass(self):
+        """
+        The decoded image should be verified once and annotated like Django's ImageField does
+        """
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with patch('django.forms.ImageField.to_python') as to_python_patch:
+            image = Base64ImageField().to_internal_value(file)
+            self.assertFalse(to_python_patch.called)
+        self.assertEqual(image.image.format, 'GIF')
+        self.assertEqual(image.image.size, (1, 1))
+        self.assertEqual(image.content_type, 'image/gif')
+        self.assertEqual(image.tell(), 0)
+
+    def test_create_with_corrupt_image(self):
+        """
+        Images that can be sniffed but not verified should be rejected
+        """
+        file = base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'\x00' * 32).decode()
+        serializer = UploadedBase64ImageSerializer(data={'created': datetime.datetime.now(), 'file': file})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {'file': [Base64ImageField.default_error_messages['invalid_image']]})
+
+    def test_create_from_buffers(self):
+        """
+        Bytes-like input should be decoded straight from its buffer
+        """
+        file = b'data:image/gif;base64,R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField()
+        strided = memoryview(bytes(byte for pair in zip(file, file.upper()) for byte in pair))[::2]
+        for data in (file, bytearray(file), memoryview(file), memoryview(b'xx' + file)[2:], strided):
+            image = field.to_internal_value(data)
+            self.assertEqual(image.read(), base64.b64decode(file[22:]))
+        self.assertIsNone(field.to_internal_value(b''))
+        with self.assertRaises(ValidationError):
+            field.to_internal_value(b'this_is_not_a_base64')
+
+    def test_header_is_only_searched_in_prefix(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with self.assertRaises(ValidationError):
+            Base64ImageField().to_internal_value('A' * 256 + ';base64,' + file)
+
+    def test_ato_internal_value(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField()
+        image = asyncio.run(field.ato_internal_value(file))
+        self.assertEqual(image.image.format, 'GIF')
+        with self.assertRaises(ValidationError):
+            asyncio.run(field.ato_internal_value('abc'))
+
+        corrupt = base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'\x00' * 32).decode()
+        with translation.override('de'):
+            with self.assertRaises(serializers.ValidationError) as context:
+                asyncio.run(field.ato_internal_value(corrupt))
+            message = str(Base64ImageField.default_error_messages['invalid_image'])
+        self.assertEqual(context.exception.detail, [message])
+        self.assertNotEqual(message, str(Base64ImageField.default_error_messages['invalid_image']))
+
+    def test_content_addressed_names(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        content_hash = hashlib.sha256(base64.b64decode(file)).hexdigest()
+        for max_memory_size in (None, 1):
+            field = Base64ImageField(content_addressed_names=True, max_memory_size=max_memory_size)
+            self.assertEqual(field.to_internal_value(file).name, content_hash + '.gif')
+
+    def test_content_addressed_names_skip_stored_files(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            field = Base64ImageField(content_addressed_names=True, storage=storage, upload_to='avatars')
+
+            image = field.to_internal_value(file)
+            stored_name = storage.save('avatars/' + image.name, image)
+            stored_file = field.to_internal_value(file)
+            self.assertIsInstance(stored_file, StoredFile)
+            self.assertEqual(stored_file.name, stored_name)
+            self.assertEqual(stored_file.image.format, 'GIF')
+            self.assertEqual(stored_file.content_type, 'image/gif')
+            self.assertEqual(stored_file.size, image.size)
+
+            # Model file fields refer to the stored file instead of saving it again.
+            model_field = ModelFileField(storage=storage, upload_to='avatars')
+            model_field.set_attributes_from_name('file')
+            instance = UploadedBase64Image(file=stored_file, created=None)
+            with patch.object(storage, 'save') as save_patch:
+                self.assertEqual(model_field.pre_save(instance, True), stored_file)
+            self.assertFalse(save_patch.called)
+
+            field = Base64ImageField(content_addressed_names=True, storage=storage, upload_to='photos')
+            self.assertEqual(field.to_internal_value(file).name, image.name)
+
+    def test_write_to_storage(self):
+        """
+        With `write_to_storage`, the payload should be decoded in chunks straight into the storage
+        """
+        content = _image_bytes((40, 40), 'PNG')
+        file = base64.b64encode(content).decode()
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            field = Base64ImageField(write_to_storage=True, storage=storage, upload_to='avatars')
+            field.DECODE_CHUNK_SIZE = 8
+            with patch('drf_extra_fields.fields.binascii.a2b_base64', wraps=binascii.a2b_base64) as a2b_base64_patch:
+                name = field.to_internal_value(file)
+            self.assertTrue(name.startswith('avatars/') and name.endswith('.png'))
+            with storage.open(name) as stored_file:
+                self.assertEqual(stored_file.read(), content)
+            self.assertTrue(all(len(call[0][0]) <= 8 for call in a2b_base64_patch.call_args_list[1:]))
+
+            # Storages can ask the stream for its size and whether it's seekable.
+            with patch.object(storage, 'save', return_value='avatars/image.png') as save_patch:
+                field.to_internal_value(file)
+            stream = save_patch.call_args[0][1]
+            self.assertEqual(stream.size, len(content))
+            self.assertFalse(stream.seekable())
+            self.assertEqual(stream.read(), content)
+
+            field = Base64ImageField(write_to_storage=True, storage=storage, content_addressed_names=True)
+            name = field.to_internal_value(file)
+            self.assertEqual(name, hashlib.sha256(content).hexdigest() + '.png')
+            self.assertEqual(field.to_internal_value(file), name)
+            self.assertEqual(len(storage.listdir('')[1]), 1)
+
+            with self.assertRaises(ValidationError):
+                field.to_internal_value(base64.b64encode(b'not an image').decode())
+            # Decoding fails after the header, before anything is written.
+            field = Base64ImageField(write_to_storage=True, storage=storage)
+            field.HEADER_CHUNK_SIZE = 12
+            with patch.object(storage, 'save') as save_patch:
+                with self.assertRaises(ValidationError):
+                    field.to_internal_value(file[:-3] + 'é')
+            self.assertFalse(save_patch.called)
+            self.assertEqual(len(storage.listdir('')[1]), 1)
+
+    def test_write_to_storage_with_image_options(self):
+        """
+        Image options that can't be applied to streamed payloads should be rejected
+        """
+        for kwargs in ({'max_width': 10}, {'max_pixels': 100}, {'resize_to': (10, 10)}, {'strip_exif': True},
+                       {'renditions': {'thumbnail': {'size': (10, 10)}}}):
+            with self.assertRaises(ImproperlyConfigured):
+                Base64ImageField(write_to_storage=True, **kwargs)
+        with self.assertRaises(ImproperlyConfigured):
+            HybridImageField(write_to_storage=True, max_height=10)
+        self.assertTrue(Base64ImageField(write_to_storage=True, max_decoded_size=10).write_to_storage)
+
+    def test_write_to_default_storage(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with tempfile.TemporaryDirectory() as location:
+            with override_settings(MEDIA_ROOT=location):
+                name = Base64ImageField(write_to_storage=True).to_internal_value(file)
+                self.assertTrue(os.path.exists(os.path.join(location, name)))
+
+    def test_image_size_limits(self):
+        file = base64.b64encode(_image_bytes((40, 30))).decode()
+        self.assertIsNotNone(Base64ImageField(max_width=40, max_height=30, max_pixels=1200).to_internal_value(file))
+        for kwargs, message in (
+            ({'max_width': 39}, 'Ensure the image is at most 39 pixels wide.'),
+            ({'max_height': 29}, 'Ensure the image is at most 29 pixels high.'),
+            ({'max_pixels': 1199}, 'Ensure the image has at most 1199 pixels.'),
+        ):
+            with patch('PIL.Image.Image.verify') as verify_patch:
+                with self.assertRaises(ValidationError) as context:
+                    Base64ImageField(**kwargs).to_internal_value(file)
+                self.assertFalse(verify_patch.called)
+            self.assertEqual(context.exception.messages, [message])
+
+    def test_hybrid_image_size_limits(self):
+        field = HybridImageField(max_width=39)
+        with self.assertRaises(ValidationError):
+            field.to_internal_value(base64.b64encode(_image_bytes((40, 30))).decode())
+        with self.assertRaises(ValidationError):
+            field.to_internal_value(SimpleUploadedFile('image.png', _image_bytes((40, 30))))
+        self.assertIsNotNone(field.to_internal_value(SimpleUploadedFile('image.png', _image_bytes((39, 30)))))
+
+    def test_process_image(self):
+        from PIL import Image
+        file = base64.b64encode(_image_bytes((400, 300), format='JPEG')).decode()
+        field = Base64ImageField(resize_to=(100, 100), output_format='webp', output_quality=80)
+        with patch('PIL.JpegImagePlugin.JpegImageFile.draft', autospec=True,
+                   side_effect=Image.Image.draft) as draft_patch:
+            image = field.to_internal_value(file)
+        self.assertTrue(draft_patch.called)
+        self.assertTrue(image.name.endswith('.webp'))
+        self.assertEqual(image.content_type, 'image/webp')
+        processed = Image.open(image)
+        self.assertEqual((processed.format, processed.size), ('WEBP', (100, 75)))
+
+    def test_process_truncated_image(self):
+        """
+        Truncated images that pass `verify()` should be rejected when they are processed
+        """
+        content = _image_bytes((400, 300), format='JPEG')
+        file = base64.b64encode(content[:len(content) // 2]).decode()
+        self.assertIsNotNone(Base64ImageField().to_internal_value(file))
+        for field in (Base64ImageField(resize_to=(100, 100)), Base64ImageField(strip_exif=True)):
+            with self.assertRaises(serializers.ValidationError) as context:
+                field.to_internal_value(file)
+            self.assertEqual(context.exception.detail, [Base64ImageField.default_error_messages['invalid_image']])
+
+    def test_process_image_strips_exif(self):
+        from PIL import Image
+        output = io.BytesIO()
+        exif = Image.Exif()
+        exif[0x010f] = 'Camera'
+        Image.new('RGB', (40, 30)).save(output, format='JPEG', exif=exif)
+        file = base64.b64encode(output.getvalue()).decode()
+
+        image = Base64ImageField().to_internal_value(file)
+        self.assertTrue(Image.open(image).getexif())
+        image = Base64ImageField(strip_exif=True).to_internal_value(file)
+        self.assertTrue(image.name.endswith('.jpg'))
+        self.assertFalse(Image.open(image).getexif())
+
+    def test_renditions(self):
+        from PIL import Image
+        file = base64.b64encode(_image_bytes((400, 300), format='JPEG')).decode()
+        renditions = {'thumbnail': {'size': (40, 40), 'format': 'webp'}, 'medium': {'size': (200, 200)}}
+        field = Base64ImageField(renditions=renditions)
+        decodes = []
+
+        def load(image):
+            # Images without tiles left are already decoded.
+            if image.tile:
+                decodes.append(image)
+            return original_load(image)
+
+        original_load = ImageFile.ImageFile.load
+        with patch('PIL.ImageFile.ImageFile.load', autospec=True, side_effect=load):
+            image = field.to_internal_value(file)
+        self.assertEqual(len(decodes), 1)
+        base_name = image.name[:-len('.jpg')]
+        self.assertEqual(image.renditions['thumbnail'].name, base_name + '_thumbnail.webp')
+        self.assertEqual(image.renditions['medium'].name, base_name + '_medium.jpg')
+        self.assertEqual(Image.open(image.renditions['thumbnail']).size, (40, 30))
+        self.assertEqual(Image.open(image.renditions['medium']).size, (200, 150))
+        self.assertEqual(Image.open(image).size, (400, 300))
+
+        image = Base64ImageField(resize_to=(100, 100), renditions=renditions).to_internal_value(file)
+        self.assertEqual(Image.open(image.renditions['medium']).size, (100, 75))
+
+    def test_renditions_of_unprocessed_image(self):
+        """
+        Renditions of images left as they are by processing, like animations, should be decoded from the file
+        """
+        from PIL import Image
+        output = io.BytesIO()
+        frames = [Image.new('RGB', (40, 30), color) for color in ('red', 'blue')]
+        frames[0].save(output, format='GIF', save_all=True, append_images=frames[1:])
+        file = base64.b64encode(output.getvalue()).decode()
+        renditions = {'thumbnail': {'size': (20, 20)}}
+        image = Base64ImageField(resize_to=(10, 10), renditions=renditions).to_internal_value(file)
+        self.assertEqual(Image.open(image).size, (40, 30))
+        self.assertEqual(Image.open(image.renditions['thumbnail']).size, (20, 15))
+
+    def test_renditions_of_truncated_image(self):
+        content = _image_bytes((400, 300), format='JPEG')
+        file = base64.b64encode(content[:len(content) // 2]).decode()
+        field = Base64ImageField(renditions={'thumbnail': {'size': (40, 40)}})
+        with self.assertRaises(serializers.ValidationError) as context:
+            field.to_internal_value(file)
+        self.assertEqual(context.exception.detail, [Base64ImageField.default_error_messages['invalid_image']])
+
+    def test_representation_rendition(self):
+        file = base64.b64encode(_image_bytes((400, 300), format='PNG')).decode()
+        renditions = {'thumbnail': {'size': (40, 40), 'format': 'webp'}}
+        image = Base64ImageField(renditions=renditions).to_internal_value(file)
+
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            field_file = FieldFile(None, ModelFileField(storage=storage), storage.save('images/' + image.name, image))
+            field = Base64ImageField(renditions=renditions, representation_rendition='thumbnail',
+                                     represent_in_base64=True)
+            field.save_renditions(field_file, image.renditions)
+
+            image.renditions['thumbnail'].seek(0)
+            self.assertEqual(field.to_representation(field_file),
+                             base64.b64encode(image.renditions['thumbnail'].read()).decode())
+
+            # Files stored without renditions fall back to the original.
+            image.seek(0)
+            field_file = FieldFile(None, ModelFileField(storage=storage), storage.save('images/other.png', image))
+            image.seek(0)
+            self.assertEqual(field.to_representation(field_file), base64.b64encode(image.read()).decode())
+
+            # URLs of renditions are built without checking the storage.
+            field = Base64ImageField(representation_rendition='thumbnail', renditions=renditions)
+            with patch.object(storage, 'exists') as exists_patch:
+                self.assertEqual(field.to_representation(field_file),
+                                 storage.url(field.get_rendition_name(field_file.name, 'thumbnail')))
+            self.assertFalse(exists_patch.called)
+
+    def test_parse_data_uri_header(self):
+        payload = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        for data in ('data:image/gif;name=a.gif;base64,' + payload,
+                     memoryview(b'data:image/gif;name=a.gif;base64,' + payload.encode())):
+            header = parse_data_uri_header(data)
+            self.assertEqual(header.mime_type, 'image/gif')
+            self.assertEqual(header.parameters, {'name': 'a.gif'})
+            self.assertEqual(data[header.offset:], payload if isinstance(data, str) else payload.encode())
+        self.assertEqual(parse_data_uri_header('data:;base64,' + payload), (None, {}, 13))
+        self.assertIsNone(parse_data_uri_header(payload))
+        with self.assertRaises(ValueError):
+            parse_data_uri_header('data:image gif;base64,' + payload)
+
+    def test_validate_content_type(self):
+        payload = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField(validate_content_type=True)
+        self.assertIsNotNone(field.to_internal_value('data:image/gif;base64,' + payload))
+        self.assertIsNotNone(field.to_internal_value('data:image/x-unknown;base64,' + payload))
+        with patch.object(Base64ImageField, 'get_file_extension') as get_file_extension_patch:
+            with self.assertRaises(ValidationError) as context:
+                field.to_internal_value('data:image/png;base64,' + payload)
+            self.assertFalse(get_file_extension_patch.called)
+        self.assertEqual(context.exception.messages, [Base64ImageField.CONTENT_TYPE_MISMATCH_MESSAGE])
+        self.assertIsNotNone(Base64ImageField().to_internal_value('data:image/png;base64,' + payload))
+
+    def test_malformed_data_uri_header(self):
+        payload = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with self.assertRaises(ValidationError) as context:
+            Base64ImageField().to_internal_value('data:image gif;base64,' + payload)
+        self.assertEqual(context.exception.messages, [Base64ImageField.INVALID_FILE_MESSAGE])
+
+    def test_trust_provided_content_type(self):
+        payload = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        file = PDFBase64FileField(trust_provided_content_type=True).to_internal_value(
+            'data:application/pdf;base64,' + payload)
+        self.assertEqual(file.content_type, 'application/pdf')
+
+    def test_get_decoded_size(self):
+        for size in range(8):
+            self.assertEqual(get_decoded_size(base64.b64encode(b'x' * size).decode()), size)
+            self.assertEqual(get_decoded_size(memoryview(base64.b64encode(b'x' * size))), size)
+
+    def test_max_decoded_size(self):
+        """
+        Payloads decoding to more than `max_decoded_size` bytes should be rejected without decoding
+        """
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        self.assertIsNotNone(Base64ImageField(max_decoded_size=43).to_internal_value(file))
+
+        field = Base64ImageField(max_decoded_size=42)
+        with patch('drf_extra_fields.fields.binascii.a2b_base64') as a2b_base64_patch:
+            with self.assertRaises(ValidationError) as context:
+                field.to_internal_value(file)
+            self.assertFalse(a2b_base64_patch.called)
+        self.assertEqual(context.exception.messages, ['Ensure this file does not exceed 42 bytes.'])
+
+        # The size is checked before the payload is scanned by `validate_base64`.
+        field = Base64ImageField(max_decoded_size=42, validate_base64=True)
+        with patch('drf_extra_fields.fields.validate_base64') as validate_base64_patch:
+            with self.assertRaises(ValidationError):
+                field.to_internal_value(file)
+            self.assertFalse(validate_base64_patch.called)
+
+    @override_settings(DRF_EXTRA_FIELDS_BASE64_MAX_DECODED_SIZE=42)
+    def test_max_decoded_size_setting(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        with self.assertRaises(ValidationError):
+            Base64ImageField().to_internal_value(file)
+        self.assertIsNotNone(Base64ImageField(max_decoded_size=43).to_internal_value(file))
+
+    def test_urlsafe_base64(self):
+        """
+        URL-safe base64 should be decoded with or without padding, also in chunks
+        """
+        content = _image_bytes((40, 40), 'PNG')
+        file = base64.urlsafe_b64encode(content).decode().rstrip('=')
+        self.assertTrue('-' in file or '_' in file)
+        with self.assertRaises(ValidationError):
+            Base64ImageField().to_internal_value(file)
+        for field in (Base64ImageField(urlsafe_base64=True), Base64ImageField(urlsafe_base64=True, max_memory_size=0)):
+            uploaded_file = field.to_internal_value(file)
+            uploaded_file.seek(0)
+            self.assertEqual(uploaded_file.read(), content)
+        self.assertIsNotNone(Base64ImageField(urlsafe_base64=True).to_internal_value(file.encode()))
+
+        # The payload is translated a chunk at a time, padded only at its end.
+        padded = base64.urlsafe_b64encode(content).decode()
+        for data in (file, padded, memoryview(file.encode()), memoryview(padded.encode())):
+            with patch.object(fields, 'URLSAFE_BASE64_CHUNK_SIZE', 64):
+                with patch('drf_extra_fields.fields.binascii.a2b_base64',
+                           wraps=binascii.a2b_base64) as a2b_base64_patch:
+                    self.assertEqual(fields.decode_base64(data, urlsafe=True), content)
+            self.assertTrue(all(len(call[0][0]) <= 64 for call in a2b_base64_patch.call_args_list))
+            self.assertEqual(a2b_base64_patch.call_args[0][0][-2:].count('=' if isinstance(data, str) else b'='),
+                             padded.count('='))
+
+    def test_mime_wrapped_base64(self):
+        content = _image_bytes((40, 40), 'PNG')
+        file = base64.encodebytes(content).decode()
+        self.assertIn('\n', file)
+        for field in (Base64ImageField(), Base64ImageField(max_memory_size=0)):
+            uploaded_file = field.to_internal_value('data:image/png;base64,' + file)
+            uploaded_file.seek(0)
+            self.assertEqual(uploaded_file.read(), content)
+
+    def test_validate_base64(self):
+        """
+        With `validate_base64`, malformed payloads should be rejected before decoding
+        """
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField(validate_base64=True)
+        self.assertIsNotNone(field.to_internal_value(file))
+        self.assertIsNotNone(field.to_internal_value(file.encode()))
+        for invalid in (file[:-1], file + '=', '*' + file, file[:40] + '\n' + file[40:], file.replace('/', '_')):
+            with patch('drf_extra_fields.fields.binascii.a2b_base64') as a2b_base64_patch:
+                with self.assertRaises(ValidationError):
+                    field.to_internal_value(invalid)
+                self.assertFalse(a2b_base64_patch.called)
+
+        field = Base64ImageField(validate_base64=True, urlsafe_base64=True)
+        self.assertIsNotNone(field.to_internal_value(file.replace('/', '_').rstrip('=')))
+        with self.assertRaises(ValidationError):
+            field.to_internal_value(file)
+
+
+class BatchUploadedBase64ImageSerializer(UploadedBase64ImageSerializer):
+    class Meta:
+        list_serializer_class = Base64ListSerializer
+
+
+class Base64ListSerializerTests(TestCase):
+    def test_batch_validation(self):
+        now = datetime.datetime.now()
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        data = [
+            {'created': now, 'file': file},
+            {'created': now, 'file': 'this_is_not_a_base64'},
+            {'created': now, 'file': ''},
+            {'created': now},
+            {'created': now, 'file': 'data:image/gif;base64,' + file},
+        ]
+        serializer = BatchUploadedBase64ImageSerializer(data=data, many=True)
+        with patch('drf_extra_fields.fields.binascii.a2b_base64', wraps=binascii.a2b_base64) as a2b_base64_patch:
+            self.assertFalse(serializer.is_valid())
+        # Each non-empty payload is decoded once for its header and once in full.
+        self.assertEqual(a2b_base64_patch.call_count, 6)
+        self.assertEqual(serializer.initial_data, data)
+        self.assertEqual(serializer.errors[1], {'file': [Base64ImageField.INVALID_FILE_MESSAGE]})
+
+        del data[1]
+        serializer = BatchUploadedBase64ImageSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data[0]['file'].image.format, 'GIF')
+        self.assertIsNone(serializer.validated_data[1]['file'])
+        self.assertNotIn('file', serializer.validated_data[2])
+        self.assertIsNot(serializer.validated_data[0]['file'], serializer.validated_data[3]['file'])
+
+    def test_batch_validation_executor(self):
+        """
+        Batches should be decoded on the shared bounded pool unless configured otherwise
+        """
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        data = [{'created': datetime.datetime.now(), 'file': file}] * 2
+        executor = fields.get_base64_executor()
+        with patch('drf_extra_fields.fields.ThreadPoolExecutor') as executor_class_patch:
+            with patch.object(executor, 'map', wraps=executor.map) as map_patch:
+                self.assertTrue(BatchUploadedBase64ImageSerializer(data=data, many=True).is_valid())
+        self.assertTrue(map_patch.called)
+        self.assertFalse(executor_class_patch.called)
+
+        class PerCallListSerializer(Base64ListSerializer):
+            executor_class = ThreadPoolExecutor
+            max_workers = 1
+
+        with patch.object(executor, 'map') as map_patch:
+            serializer = PerCallListSerializer(child=UploadedBase64ImageSerializer(), data=data)
+            self.assertTrue(serializer.is_valid())
+        self.assertFalse(map_patch.called)
+
+    def test_batch_validation_error_language(self):
+        """
+        Errors raised on the worker threads should be in the active language
+        """
+        file = base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'\x00' * 32).decode()
+        data = [{'created': datetime.datetime.now(), 'file': file}]
+        with translation.override('de'):
+            expected = UploadedBase64ImageSerializer(data=data, many=True)
+            self.assertFalse(expected.is_valid())
+            serializer = BatchUploadedBase64ImageSerializer(data=data, many=True)
+            self.assertFalse(serializer.is_valid())
+            message = str(Base64ImageField.default_error_messages['invalid_image'])
+        self.assertEqual(serializer.errors, expected.errors)
+        self.assertEqual(serializer.errors[0], {'file': [message]})
+        self.assertNotEqual(message, str(Base64ImageField.default_error_messages['invalid_image']))
+
+    def test_to_internal_values(self):
+        file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+        field = Base64ImageField()
+        values, errors = field.to_internal_values([file, 'abc', file])
+        self.assertEqual([value is None for value in values], [False, True, False])
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(errors[1].messages, [Base64ImageField.INVALID_FILE_MESSAGE])
+
 
 class PDFBase64FileField(Base64FileField):
     ALLOWED_TYPES = ('pdf',)
@@ -186,6 +779,10 @@ class PDFBase64FileField(Base64FileField):
         return 'pdf'
 
 
+class DocumentBase64FileField(Base64FileField):
+    ALLOWED_TYPES = ('pdf', 'png', 'mp4')
+
+
 class UploadedBase64FileSerializer(serializers.Serializer):
     file = PDFBase64FileField(required=False)
     created = serializers.DateTimeField()
@@ -262,6 +859,142 @@ class Base64FileSerializerTests(TestCase):
         finally:
             os.remove('im.jpg')
 
+    def test_download_lazily(self):
+        encoded_source = 'R0lGODlhAQABAIAAAAUEBAAAACwAAAAAAQABAAACAkQBADs='
+
+        with open('im.jpg', 'wb') as im_file:
+            im_file.write(base64.b64decode(encoded_source))
+        file = DownloadableBase64File(os.path.abspath('im.jpg'))
+        field = PDFBase64FileField(represent_in_base64=True, lazy_representation=True)
+        field.ENCODE_CHUNK_SIZE = 6
+
+        try:
+            representation = field.to_representation(file.file)
+            self.assertIsInstance(representation, LazyBase64String)
+            self.assertGreater(len(list(representation.chunks())), 1)
+            self.assertEqual(''.join(representation.chunks()), encoded_source)
+            self.assertEqual(representation, encoded_source)
+            self.assertEqual(JSONRenderer().render({'file': representation}),
+                             ('{"file":"%s"}' % encoded_source).encode())
+        finally:
+            os.remove('im.jpg')
+
+    def test_representation_cache(self):
+        encoded_source = 'R0lGODlhAQABAIAAAAUEBAAAACwAAAAAAQABAAACAkQBADs='
+        cache = Base64RepresentationCache(max_size=100)
+        field = PDFBase64FileField(represent_in_base64=True, representation_cache=cache)
+
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            storage.save('a.pdf', ContentFile(base64.b64decode(encoded_source)))
+            storage.save('b.pdf', ContentFile(b'b' * 60))
+            file_a = FieldFile(None, ModelFileField(storage=storage), 'a.pdf')
+            file_b = FieldFile(None, ModelFileField(storage=storage), 'b.pdf')
+
+            self.assertEqual(field.to_representation(file_a), encoded_source)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            with patch.object(FieldFile, 'open') as open_patch:
+                self.assertEqual(field.to_representation(file_a), encoded_source)
+                self.assertFalse(open_patch.called)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # Caching `b` exceeds `max_size`, so the least recently used `a` is evicted
+            self.assertEqual(field.to_representation(file_b), base64.b64encode(b'b' * 60).decode())
+            self.assertEqual(cache.size, 80)
+            field.to_representation(file_a)
+            self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+            # Changing the stored content changes the key
+            storage.delete('a.pdf')
+            storage.save('a.pdf', ContentFile(b'changed'))
+            file_a = FieldFile(None, ModelFileField(storage=storage), 'a.pdf')
+            self.assertEqual(field.to_representation(file_a), base64.b64encode(b'changed').decode())
+
+    def test_representation_cache_django_cache_tier(self):
+        encoded_source = 'R0lGODlhAQABAIAAAAUEBAAAACwAAAAAAQABAAACAkQBADs='
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileSystemStorage(location=location)
+            storage.save('a.pdf', ContentFile(base64.b64decode(encoded_source)))
+            file = FieldFile(None, ModelFileField(storage=storage), 'a.pdf')
+
+            PDFBase64FileField(
+                represent_in_base64=True, representation_cache=Base64RepresentationCache(cache_alias='default')
+            ).to_representation(file)
+
+            cache = Base64RepresentationCache(cache_alias='default')
+            field = PDFBase64FileField(represent_in_base64=True, representation_cache=cache)
+            with patch.object(FieldFile, 'open') as open_patch:
+                self.assertEqual(field.to_representation(file), encoded_source)
+                self.assertFalse(open_patch.called)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_ato_representation(self):
+        encoded_source = 'R0lGODlhAQABAIAAAAUEBAAAACwAAAAAAQABAAACAkQBADs='
+
+        with open('im.jpg', 'wb') as im_file:
+            im_file.write(base64.b64decode(encoded_source))
+        file = DownloadableBase64File(os.path.abspath('im.jpg'))
+
+        try:
+            field = PDFBase64FileField(represent_in_base64=True)
+            with patch('drf_extra_fields.fields.run_in_base64_executor',
+                       wraps=fields.run_in_base64_executor) as executor_patch:
+                self.assertEqual(asyncio.run(field.ato_representation(file.file)), encoded_source)
+            self.assertTrue(executor_patch.called)
+            self.assertEqual(asyncio.run(PDFBase64FileField().ato_representation(None)), None)
+        finally:
+            os.remove('im.jpg')
+
+    def test_iter_base64_encode(self):
+        class ShortReads(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 5))
+
+        content = os.urandom(1000)
+        for chunk_size in (3, 7, 64, 4096):
+            self.assertEqual(''.join(iter_base64_encode(ShortReads(content), chunk_size)),
+                             base64.b64encode(content).decode())
+
+
+class FileTypeDetectionTests(TestCase):
+    def tearDown(self):
+        FILE_SIGNATURES['pdf'] = [((0, b'%PDF-'),)]
+        FILE_DETECTORS.pop('csv', None)
+        file_types.detectors_cache.clear()
+
+    def test_detect_allowed_types(self):
+        field = DocumentBase64FileField()
+        for content, extension in (
+            (b'%PDF-1.4\n', 'pdf'),
+            (b'\x89PNG\r\n\x1a\n' + b'\x00' * 8, 'png'),
+            (b'\x00\x00\x00\x18ftypmp42', 'mp4'),
+        ):
+            file = field.to_internal_value(base64.b64encode(content).decode())
+            self.assertTrue(file.name.endswith('.' + extension))
+
+        with self.assertRaises(ValidationError) as context:
+            field.to_internal_value(base64.b64encode(b'GIF89a').decode())
+        self.assertEqual(context.exception.messages, [Base64FileField.INVALID_TYPE_MESSAGE])
+
+    def test_detector_is_built_once(self):
+        self.assertIs(get_file_type_detector(('pdf', 'png')), get_file_type_detector(('pdf', 'png')))
+        self.assertEqual(get_file_type_detector(('pdf', 'png')).header_size, 8)
+
+    def test_register_file_signature(self):
+        detector = get_file_type_detector(('pdf',))
+        register_file_signature('pdf', (0, b'\xef\xbb\xbf%PDF-'))
+        self.assertIsNot(get_file_type_detector(('pdf',)), detector)
+        self.assertEqual(get_file_type_detector(('pdf',)).detect(b'\xef\xbb\xbf%PDF-1.4'), 'pdf')
+
+    def test_register_file_detector(self):
+        register_file_detector('csv', lambda header: header.count(b',') > 1)
+
+        class CSVBase64FileField(Base64FileField):
+            ALLOWED_TYPES = ('pdf', 'csv')
+
+        file = CSVBase64FileField().to_internal_value(base64.b64encode(b'a,b,c\n1,2,3\n').decode())
+        self.assertTrue(file.name.endswith('.csv'))
+
 
 class SavePoint:
     def __init__(self, point=None, created=None):
@@ -882,6 +1615,314 @@ class TestDateRangeField(FieldValues):
         assert serializer.is_valid()
 
 
+class LiteralRangeSerializer(serializers.Serializer):
+    range = DateTimeRangeField(format='literal')
+
+
+@override_settings(USE_TZ=True)
+class TestDateTimeRangeFieldLiteralFormat(TestCase, FieldValues):
+    serializer_class = LiteralRangeSerializer
+
+    valid_inputs = [
+        ('[2001-01-01T13:00:00Z,2001-02-02T13:00:00Z)',
+         DateTimeTZRange(datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc),
+                         datetime.datetime(2001, 2, 2, 13, 00, tzinfo=pytz.utc), '[)')),
+        (' ( "2001-01-01 13:00:00+00" , ] ',
+         DateTimeTZRange(datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc), None, '(]')),
+        ('[,)', DateTimeTZRange(None, None, '[)')),
+        ('empty', DateTimeTZRange(empty=True)),
+        ({'lower': '2001-01-01T13:00:00Z', 'bounds': '[)'},
+         DateTimeTZRange(datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc), None, '[)')),
+    ]
+    invalid_inputs = [
+        ('[2001-01-01T13:00:00Z,2001-02-02T13:00:00Z',
+         ['Expected a range literal like "[lower,upper)" but got "[2001-01-01T13:00:00Z,2001-02-02T13:00:00Z".']),
+        ('[a,)', ['Datetime has wrong format. Use one of these formats instead: '
+                  'YYYY-MM-DDThh:mm[:ss[.uuuuuu]][+HH:MM|-HH:MM|Z].']),
+        ('[2001-02-02T13:00:00Z,2001-01-01T13:00:00Z)',
+         ['The start of the range must not exceed the end of the range.']),
+    ]
+    outputs = [
+        (DateTimeTZRange(datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc),
+                         datetime.datetime(2001, 2, 2, 13, 00, tzinfo=pytz.utc), '(]'),
+         '(2001-01-01T13:00:00Z,2001-02-02T13:00:00Z]'),
+        (DateTimeTZRange(None, datetime.datetime(2001, 2, 2, 13, 00, tzinfo=pytz.utc)),
+         '(,2001-02-02T13:00:00Z)'),
+        (DateTimeTZRange(empty=True), 'empty'),
+    ]
+    field = DateTimeRangeField(format='literal')
+
+    def test_quoting(self):
+        field = DateTimeRangeField(format='literal', child_attrs={'format': '%Y-%m-%d %H:%M'})
+        value = DateTimeTZRange(datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc), None)
+        self.assertEqual(field.to_representation(value), '["2001-01-01 13:00",)')
+        self.assertEqual(field.to_internal_value(field.to_representation(value)), value)
+
+
+class TestDateRangeFieldISO8601Format(FieldValues):
+    serializer_class = DateRangeSerializer
+
+    valid_inputs = [
+        ('2001-01-01/2001-02-01', DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 2, 1))),
+        ('../2001-02-01', DateRange(None, datetime.date(2001, 2, 1))),
+        ('2001-01-01/', DateRange(datetime.date(2001, 1, 1), None)),
+    ]
+    invalid_inputs = [
+        ('2001-01-01', ['Expected an ISO 8601 interval like "start/end" but got "2001-01-01".']),
+        ('2001-02-01/2001-01-01', ['The start of the range must not exceed the end of the range.']),
+    ]
+    outputs = [
+        (DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 2, 1)), '2001-01-01/2001-02-01'),
+        (DateRange(datetime.date(2001, 1, 1), None), '2001-01-01/..'),
+        (DateRange(empty=True), 'empty'),
+    ]
+    field = DateRangeField(format='iso-8601')
+
+    def test_numeric_range(self):
+        field = IntegerRangeField(format='iso-8601')
+        assert field.to_internal_value('1/5') == NumericRange(1, 5)
+        assert field.to_representation(NumericRange(1, 5)) == '1/5'
+
+    def test_round_trip(self):
+        """
+        Ranges with bounds other than `[)` should be represented so that they parse back unchanged
+        """
+        field = IntegerRangeField(format='iso-8601')
+        assert field.to_representation(NumericRange(1, 5, '[]')) == '1/6'
+        assert field.to_representation(NumericRange(None, 5, '(]')) == '../6'
+        assert field.to_representation(NumericRange(1, 2, '()')) == 'empty'
+        assert self.field.to_representation(
+            DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 1, 31), '(]')
+        ) == '2001-01-02/2001-02-01'
+
+        field = FloatRangeField(format='iso-8601')
+        for value, representation in (
+            (NumericRange(1.5, 2.5, '[]'), '[1.5,2.5]'),
+            (NumericRange(1.5, None, '(]'), '(1.5,)'),
+            (NumericRange(None, 2.5, '(]'), '(,2.5]'),
+            (NumericRange(None, 2.5, '()'), '../2.5'),
+        ):
+            assert field.to_representation(value) == representation
+            assert get_range_bounds(field.to_internal_value(representation)) == get_range_bounds(value)
+
+
+class NativeRangeBoundsTests(TestCase):
+    def test_native_bounds(self):
+        """
+        Bounds that already are of the child's type should validate like their primitive form
+        """
+        lower, upper = datetime.datetime(2001, 1, 1, 13, 00), datetime.datetime(2001, 2, 2, 13, 00, tzinfo=pytz.utc)
+        for field, native, primitive in (
+            (IntegerRangeField(), {'lower': 1, 'upper': 5}, {'lower': '1', 'upper': '5'}),
+            (FloatRangeField(), {'lower': 1.5, 'bounds': '[]'}, {'lower': '1.5', 'bounds': '[]'}),
+            (DecimalRangeField(), {'lower': Decimal('1.50')}, {'lower': '1.50'}),
+            (DecimalRangeField(child=DecimalField(max_digits=5, decimal_places=2)), {'lower': Decimal('1.5')},
+             {'lower': '1.5'}),
+            (DateRangeField(), {'lower': lower.date()}, {'lower': '2001-01-01'}),
+            (DateTimeRangeField(), {'lower': lower, 'upper': upper},
+             {'lower': '2001-01-01T13:00:00', 'upper': '2001-02-02T13:00:00Z'}),
+        ):
+            with override_settings(USE_TZ=True):
+                self.assertEqual(field.to_internal_value(native), field.to_internal_value(primitive))
+
+        with patch.object(IntegerField, 'to_internal_value') as to_internal_value_patch:
+            IntegerRangeField().to_internal_value({'lower': 1, 'upper': 5})
+        self.assertFalse(to_internal_value_patch.called)
+
+    def test_native_bounds_validation(self):
+        field = IntegerRangeField(child_attrs={'min_value': 0})
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.to_internal_value({'lower': -1})
+        assert exc_info.value.detail == ['Ensure this value is greater than or equal to 0.']
+        for field, value in ((FloatRangeField(), float('inf')), (DecimalRangeField(), Decimal('NaN'))):
+            with pytest.raises(serializers.ValidationError):
+                field.to_internal_value({'lower': value})
+        with pytest.raises(serializers.ValidationError):
+            DateRangeField().to_internal_value({'lower': datetime.datetime(2001, 1, 1)})
+
+
+class MultiRangeFieldTests(TestCase):
+    def test_merge_discrete_ranges(self):
+        field = IntegerMultiRangeField()
+        value = field.to_internal_value([
+            {'lower': 10, 'upper': 12, 'bounds': '[]'},
+            {'lower': 1, 'upper': 3},
+            {'lower': 3, 'upper': 5},
+            {'empty': True},
+            {'lower': 6, 'upper': 9, 'bounds': '(]'},
+            {'lower': 11, 'upper': 11, 'bounds': '[]'},
+        ])
+        self.assertEqual(list(value), [NumericRange(1, 5), NumericRange(7, 13)])
+        self.assertEqual(list(field.to_internal_value([])), [])
+
+        value = DateMultiRangeField().to_internal_value([
+            {'lower': '2001-01-03', 'upper': '2001-01-05'},
+            {'lower': '2001-01-01', 'upper': '2001-01-02', 'bounds': '[]'},
+        ])
+        self.assertEqual(list(value), [DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 1, 5))])
+
+    def test_null_ranges(self):
+        field = IntegerMultiRangeField(child_attrs={'allow_null': True})
+        value = field.to_internal_value([{'lower': 3, 'upper': 5}, None, {'lower': 1, 'upper': 3}])
+        self.assertEqual(value, [NumericRange(1, 5)])
+
+    @override_settings(USE_TZ=True)
+    def test_merge_continuous_ranges(self):
+        field = DateTimeMultiRangeField()
+        value = field.to_internal_value([
+            {'lower': '2001-01-01T12:00:00Z', 'upper': '2001-01-01T14:00:00Z'},
+            {'lower': '2001-01-01T10:00:00Z', 'upper': '2001-01-01T11:00:00Z'},
+            {'lower': '2001-01-01T11:00:00Z', 'upper': '2001-01-01T12:00:00Z', 'bounds': '()'},
+            {'lower': '2001-01-01T13:00:00Z', 'upper': '2001-01-01T13:30:00Z', 'bounds': '[]'},
+            {'upper': '2001-01-01T09:00:00Z'},
+            {'lower': '2001-01-02T00:00:00Z', 'bounds': '(]'},
+            {'lower': '2001-01-03T00:00:00Z', 'upper': '2001-01-04T00:00:00Z'},
+        ])
+        self.assertEqual(field.to_representation(value), [
+            {'lower': None, 'upper': '2001-01-01T09:00:00Z', 'bounds': '()'},
+            {'lower': '2001-01-01T10:00:00Z', 'upper': '2001-01-01T11:00:00Z', 'bounds': '[)'},
+            {'lower': '2001-01-01T11:00:00Z', 'upper': '2001-01-01T14:00:00Z', 'bounds': '()'},
+            {'lower': '2001-01-02T00:00:00Z', 'upper': None, 'bounds': '()'},
+        ])
+
+    def test_invalid_ranges(self):
+        field = IntegerMultiRangeField(child_attrs={'child_attrs': {'min_value': 0}})
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.run_validation([{'lower': 1}, {'lower': -1}, 'a'])
+        self.assertEqual(set(exc_info.value.detail), {1, 2})
+
+
+class SlotSerializer(serializers.Serializer):
+    slot = DateTimeRangeField()
+
+
+class SlotListSerializer(RangeListSerializer):
+    default_validators = [NonOverlappingRangesValidator('slot')]
+
+
+class NonOverlappingRangesValidatorTests(TestCase):
+    def test_find_overlapping_ranges(self):
+        ranges = [
+            NumericRange(10, 20),
+            NumericRange(20, 30),
+            NumericRange(0, 5, '[]'),
+            NumericRange(5, 6),
+            NumericRange(12, 15),
+            NumericRange(empty=True),
+            None,
+            NumericRange(40, None),
+            NumericRange(50, 60),
+            NumericRange(None, -1),
+        ]
+        self.assertEqual(sorted(find_overlapping_ranges(ranges)), [(0, 4), (2, 3), (7, 8)])
+        self.assertEqual(find_overlapping_ranges([NumericRange(None, None), NumericRange(None, 1)]), [(0, 1)])
+        self.assertEqual(find_overlapping_ranges([NumericRange(1, 2, '[]'), NumericRange(2, 3, '(]')]), [])
+
+    def test_find_overlapping_discrete_ranges(self):
+        ranges = [NumericRange(1, 2, '[)'), NumericRange(1, 3, '()')]
+        self.assertEqual(find_overlapping_ranges(ranges), [(0, 1)])
+        # Over integers, these are {1} and {2}.
+        self.assertEqual(find_overlapping_ranges(ranges, discrete_step=1), [])
+        self.assertEqual(find_overlapping_ranges([NumericRange(1, 3, '(]'), NumericRange(2, 4, '()')], 1), [(0, 1)])
+        self.assertEqual(find_overlapping_ranges([NumericRange(1, 2, '(]'), NumericRange(2, 4, '(]')], 1), [])
+        self.assertEqual(find_overlapping_ranges([NumericRange(1, 2, '()'), NumericRange(1, 2, '[]')], 1), [])
+
+        day = datetime.timedelta(days=1)
+        dates = [
+            DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 1, 2), '[)'),
+            DateRange(datetime.date(2001, 1, 1), datetime.date(2001, 1, 3), '()'),
+            DateRange(datetime.date(2001, 1, 2), datetime.date(2001, 1, 2), '[]'),
+        ]
+        self.assertEqual(find_overlapping_ranges(dates[:2], day), [])
+        self.assertEqual(find_overlapping_ranges(dates[1:], day), [(0, 1)])
+
+    def test_discrete_step_of_range_field(self):
+        field = serializers.ListField(child=IntegerRangeField(), validators=[NonOverlappingRangesValidator()])
+        data = [{'lower': 1, 'upper': 2, 'bounds': '[)'}, {'lower': 1, 'upper': 3, 'bounds': '()'}]
+        self.assertEqual(len(field.run_validation(data)), 2)
+
+        class DayListSerializer(serializers.ListSerializer):
+            default_validators = [NonOverlappingRangesValidator('day')]
+
+        class DaySerializer(serializers.Serializer):
+            day = DateRangeField()
+
+        data = [
+            {'day': {'lower': '2001-01-01', 'upper': '2001-01-01', 'bounds': '[]'}},
+            {'day': {'lower': '2001-01-01', 'upper': '2001-01-03', 'bounds': '()'}},
+        ]
+        self.assertTrue(DayListSerializer(child=DaySerializer(), data=data).is_valid())
+        data[1]['day']['bounds'] = '[)'
+        self.assertFalse(DayListSerializer(child=DaySerializer(), data=data).is_valid())
+
+    def test_many_serializer(self):
+        data = [
+            {'slot': {'lower': '2001-01-01T10:00:00Z', 'upper': '2001-01-01T12:00:00Z'}},
+            {'slot': {'lower': '2001-01-01T12:00:00Z', 'upper': '2001-01-01T13:00:00Z'}},
+            {'slot': {'lower': '2001-01-01T09:00:00Z', 'upper': '2001-01-01T10:30:00Z'}},
+        ]
+        serializer = SlotListSerializer(child=SlotSerializer(), data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {
+            'non_field_errors': ['The range at index 2 overlaps the range at index 0.']
+        })
+
+        del data[2]
+        self.assertTrue(SlotListSerializer(child=SlotSerializer(), data=data).is_valid())
+
+    def test_list_field(self):
+        field = serializers.ListField(child=IntegerRangeField(), validators=[NonOverlappingRangesValidator()])
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            field.run_validation([{'lower': 1, 'upper': 5}, {'lower': 4, 'upper': 8}])
+        assert exc_info.value.detail == ['The range at index 1 overlaps the range at index 0.']
+        assert exc_info.value.get_codes() == ['overlap']
+
+
+class BookingSerializer(serializers.Serializer):
+    slot = DateTimeRangeField()
+    day = DateRangeField()
+    formatted_slot = DateTimeRangeField(source='slot', child_attrs={'format': '%Y-%m-%d %H:%M'})
+    seats = IntegerRangeField()
+
+    class Meta:
+        list_serializer_class = RangeListSerializer
+
+
+class RangeListSerializerTests(TestCase):
+    def get_rows(self):
+        start = datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc)
+        naive_start = datetime.datetime(2001, 6, 1, 13, 00)
+        return [
+            {'slot': DateTimeTZRange(start, start + datetime.timedelta(hours=1)),
+             'day': DateRange(start.date(), None), 'seats': NumericRange(1, 3)},
+            {'slot': DateTimeTZRange(naive_start, None, '[]'),
+             'day': DateRange(empty=True), 'seats': NumericRange(None, 3)},
+            {'slot': {'lower': '2001-01-01T13:00:00Z', 'upper': None, 'bounds': '[)'},
+             'day': {}, 'seats': NumericRange(empty=True)},
+        ]
+
+    def test_same_representation(self):
+        """
+        Representing a list of rows at once should give the same result as row by row
+        """
+        rows = self.get_rows()
+        for settings in ({'USE_TZ': True}, {'USE_TZ': True, 'TIME_ZONE': 'Asia/Tokyo'}, {'USE_TZ': False}):
+            with override_settings(**settings):
+                serializer = BookingSerializer(rows, many=True)
+                self.assertEqual(serializer.data, [BookingSerializer(row).data for row in rows])
+                self.assertIsNone(serializer.child.fields['slot'].bound_representer)
+
+    def test_bound_representer(self):
+        for field, values in (
+            (TestDateTimeRangeField.field, [datetime.datetime(2001, 1, 1, 13, 00, tzinfo=pytz.utc), '2001-01-01']),
+            (TestDateRangeField.field, [datetime.date(2001, 1, 1), '2001-01-01']),
+            (TestIntegerRangeField.field, [1, '1']),
+        ):
+            represent_bound = field.get_bound_representer()
+            for value in values:
+                self.assertEqual(represent_bound(value), field.child.to_representation(value))
+
+
 class EmailSerializer(serializers.Serializer):
     email = LowercaseEmailField()
 
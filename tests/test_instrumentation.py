@@ -0,0 +1,147 @@
+import base64
+import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.test import TestCase
+
+from drf_extra_fields import instrumentation
+from drf_extra_fields.compat import NumericRange
+from drf_extra_fields.fields import Base64ImageField, Base64RepresentationCache, IntegerRangeField
+from drf_extra_fields.instrumentation import (
+    FieldEvent,
+    OpenTelemetryListener,
+    StatsdListener,
+    register_listener,
+    unregister_listener,
+)
+from drf_extra_fields.relations import PresentablePrimaryKeyRelatedField
+from .test_fields import BatchUploadedBase64ImageSerializer
+from .test_relations import PresentationSerializer
+from .utils import MockObject, MockQueryset
+
+
+class InstrumentationTests(TestCase):
+    file = 'R0lGODlhAQABAIAAAP///////yH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=='
+
+    def setUp(self):
+        self.events = []
+        register_listener(self.events.append)
+        self.addCleanup(unregister_listener, self.events.append)
+
+    def get_events(self, operation):
+        return [event for event in self.events if event.operation == operation]
+
+    def test_base64_field_events(self):
+        field = Base64ImageField()
+        image = field.to_internal_value(self.file)
+
+        event, = self.get_events('to_internal_value')
+        self.assertIs(event.field, field)
+        self.assertEqual(event.name, 'Base64ImageField.to_internal_value')
+        self.assertEqual(event.input_size, len(self.file))
+        self.assertEqual(event.output_size, image.size)
+        self.assertGreaterEqual(event.duration, 0)
+        self.assertIsNone(event.error)
+        event, = self.get_events('get_header_extension')
+        self.assertEqual(event.input_size, len(base64.b64decode(self.file)))
+        self.assertEqual(len(self.get_events('validate_file')), 1)
+
+    def test_batch_events(self):
+        now = datetime.datetime.now()
+        data = [{'created': now, 'file': self.file}, {'created': now, 'file': 'this_is_not_a_base64'}]
+        self.assertFalse(BatchUploadedBase64ImageSerializer(data=data, many=True).is_valid())
+
+        events = self.get_events('to_internal_value')
+        self.assertEqual(sorted(event.input_size for event in events), sorted(len(item['file']) for item in data))
+        self.assertEqual([event.reason for event in events if event.error is not None],
+                         [Base64ImageField.INVALID_FILE_MESSAGE])
+
+    def test_failure_reason(self):
+        with self.assertRaises(ValidationError):
+            Base64ImageField().to_internal_value('this_is_not_a_base64')
+        event, = self.get_events('to_internal_value')
+        self.assertIsInstance(event.error, ValidationError)
+        self.assertEqual(event.reason, Base64ImageField.INVALID_FILE_MESSAGE)
+
+        with self.assertRaises(Exception):
+            IntegerRangeField().to_internal_value({'lower': 'a'})
+        event, = self.get_events('to_internal_value')[1:]
+        self.assertEqual(event.reason, 'invalid')
+
+    def test_failing_listener(self):
+        listener = Mock(side_effect=RuntimeError('statsd is down'))
+        register_listener(listener)
+        self.addCleanup(unregister_listener, listener)
+
+        with self.assertLogs('drf_extra_fields.instrumentation', 'ERROR'):
+            self.assertIsNotNone(Base64ImageField().to_internal_value(self.file))
+        with self.assertLogs('drf_extra_fields.instrumentation', 'ERROR'):
+            with self.assertRaises(ValidationError) as context:
+                Base64ImageField().to_internal_value('this_is_not_a_base64')
+        self.assertEqual(context.exception.messages, [Base64ImageField.INVALID_FILE_MESSAGE])
+        self.assertEqual(len(self.get_events('to_internal_value')), 2)
+
+    def test_representation_cache_events(self):
+        field = Base64ImageField(represent_in_base64=True, representation_cache=Base64RepresentationCache())
+        file = ContentFile(base64.b64decode(self.file), name='image.gif')
+        file.storage = Mock(get_modified_time=Mock(return_value=None))
+        representation = field.to_representation(file)
+        field.to_representation(file)
+
+        self.assertEqual([event.cache_hit for event in self.get_events('representation_cache')], [False, True])
+        self.assertEqual(
+            [event.output_size for event in self.get_events('to_representation')], [len(representation)] * 2
+        )
+
+    def test_other_fields(self):
+        IntegerRangeField().to_representation(NumericRange(1, 2))
+        PresentablePrimaryKeyRelatedField(
+            queryset=MockQueryset([]), presentation_serializer=PresentationSerializer
+        ).to_representation(MockObject(pk=1, name='foo'))
+        self.assertEqual(
+            [event.name for event in self.events],
+            ['IntegerRangeField.to_representation', 'PresentablePrimaryKeyRelatedField.to_representation']
+        )
+
+    def test_disabled(self):
+        unregister_listener(self.events.append)
+        with patch.object(instrumentation.time, 'perf_counter') as perf_counter_patch:
+            Base64ImageField().to_internal_value(self.file)
+        self.assertFalse(perf_counter_patch.called)
+        self.assertEqual(self.events, [])
+
+    def test_statsd_listener(self):
+        client = Mock()
+        listener = StatsdListener(client)
+        listener(FieldEvent(Base64ImageField(), 'to_internal_value', duration=0.5, input_size=60, output_size=42))
+        client.timing.assert_called_once_with('drf_extra_fields.Base64ImageField.to_internal_value', 500)
+        client.incr.assert_any_call('drf_extra_fields.Base64ImageField.to_internal_value.input_bytes', 60)
+        client.incr.assert_any_call('drf_extra_fields.Base64ImageField.to_internal_value.output_bytes', 42)
+
+        listener(FieldEvent(Base64ImageField(), 'representation_cache', cache_hit=True, error=ValueError()))
+        client.incr.assert_any_call('drf_extra_fields.Base64ImageField.representation_cache.hits')
+        client.incr.assert_any_call('drf_extra_fields.Base64ImageField.representation_cache.errors')
+
+    def test_opentelemetry_listener(self):
+        pytest.importorskip('opentelemetry.sdk')
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        listener = OpenTelemetryListener(provider.get_tracer('tests'))
+        register_listener(listener)
+        self.addCleanup(unregister_listener, listener)
+        with self.assertRaises(ValidationError):
+            Base64ImageField().to_internal_value('this_is_not_a_base64')
+
+        span = exporter.get_finished_spans()[-1]
+        self.assertEqual(span.name, 'Base64ImageField.to_internal_value')
+        self.assertEqual(span.attributes['drf_extra_fields.input_size'], len('this_is_not_a_base64'))
+        self.assertEqual(span.status.description, Base64ImageField.INVALID_FILE_MESSAGE)
+        self.assertGreaterEqual(span.end_time, span.start_time)
@@ -1,16 +1,25 @@
+import datetime
+
 import django
 from django.contrib.postgres.fields import (
+    ArrayField,
     DateRangeField,
     DateTimeRangeField,
     IntegerRangeField,
     DecimalRangeField
 )
-from django.db import models
+from django.db import connection, models
 from django.test import TestCase
 from rest_framework import serializers
 import pytest
 
 from drf_extra_fields import compat
+from drf_extra_fields import fields as extra_fields
+from drf_extra_fields.fields import (
+    DateMultiRangeField,
+    DateTimeMultiRangeField,
+    MultiRangeModelSerializerMixin,
+)
 
 
 def dedent(blocktext):
@@ -70,3 +79,54 @@ class TestPosgreFieldMappings(TestCase):
         """)
 
         self.assertEqual(repr(TestSerializer()), expected)
+
+
+class ArrayOfRangesModel(models.Model):
+    date_ranges = ArrayField(DateRangeField())
+    datetime_ranges = ArrayField(DateTimeRangeField(), blank=True)
+    integers = ArrayField(models.IntegerField())
+
+    class Meta:
+        app_label = 'tests'
+
+
+class TestMultiRangeFieldMappings(TestCase):
+    def test_array_of_range_fields(self):
+        """
+        Arrays of range model fields should map to multirange fields with the mixin.
+        """
+        class TestSerializer(MultiRangeModelSerializerMixin, serializers.ModelSerializer):
+            class Meta:
+                model = ArrayOfRangesModel
+                fields = ("date_ranges", "datetime_ranges", "integers")
+
+        fields = TestSerializer().fields
+        self.assertIsInstance(fields["date_ranges"], DateMultiRangeField)
+        self.assertIsInstance(fields["date_ranges"].child, extra_fields.DateRangeField)
+        self.assertFalse(fields["date_ranges"].allow_empty)
+        self.assertIsInstance(fields["datetime_ranges"], DateTimeMultiRangeField)
+        self.assertIs(type(fields["integers"]), serializers.ListField)
+
+    @pytest.mark.skipif(not compat.DateRange.__module__.startswith("psycopg."), reason="requires psycopg 3")
+    def test_save_array_of_range_fields(self):
+        """
+        Validated multiranges should be saved by psycopg 3 as arrays of ranges, not as multiranges.
+        """
+        from psycopg.adapt import PyFormat, Transformer
+        from psycopg.postgres import types
+
+        class TestSerializer(MultiRangeModelSerializerMixin, serializers.ModelSerializer):
+            class Meta:
+                model = ArrayOfRangesModel
+                fields = ("date_ranges",)
+
+        serializer = TestSerializer(data={"date_ranges": [
+            {"lower": "2020-01-10", "upper": "2020-01-20"},
+            {"lower": "2020-01-01", "upper": "2020-01-15"},
+        ]})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        instance = ArrayOfRangesModel(**serializer.validated_data)
+        value = ArrayOfRangesModel._meta.get_field("date_ranges").get_db_prep_save(instance.date_ranges, connection)
+        self.assertEqual(value, [compat.DateRange(datetime.date(2020, 1, 1), datetime.date(2020, 1, 20))])
+        dumper = Transformer().get_dumper(value, PyFormat.BINARY).upgrade(value, PyFormat.BINARY)
+        self.assertEqual(dumper.oid, types["daterange"].array_oid)